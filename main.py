@@ -7,95 +7,556 @@ import re
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QVBoxLayout, 
                              QHBoxLayout, QWidget, QLabel, QProgressBar, QPushButton,
                              QSlider, QComboBox, QTextEdit, QGroupBox, QGridLayout,
-                             QMessageBox, QSpinBox, QCheckBox)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+                             QMessageBox, QSpinBox, QCheckBox, QScrollArea)
+from PyQt6.QtCore import (Qt, QTimer, QObject, QEvent, QRunnable, QThreadPool, QSocketNotifier,
+                          pyqtSignal)
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
 import subprocess
 import json
 import psutil
-import platform
 import shutil
+import time
+import atexit
+import threading
+from collections import namedtuple
+import select
+import csv
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: NVML bindings (nvidia-ml-py) avoid forking nvidia-smi on every poll
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# Optional: lets the brightness fallback talk RandR directly instead of forking xrandr
+try:
+    from Xlib import display as xdisplay
+except ImportError:
+    xdisplay = None
+
+def _read_cpu_model():
+    """Read the CPU model name once from /proc/cpuinfo"""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return "Unknown CPU"
+
+# Static for the lifetime of the process, so resolve it at import
+CPU_MODEL = _read_cpu_model()
+
+BACKLIGHT_CLASS = '/sys/class/backlight'
+# Preferred backlight devices; any other device the kernel exposes is tried after these
+BACKLIGHT_DEVICES = ['intel_backlight', 'acpi_video0', 'amdgpu_bl0', 'nvidia_backlight']
+
+# Results of expensive psutil queries, keyed by name: {key: (timestamp, value)}
+_CACHE = {}
+
+def _cached(key, ttl, fn):
+    """Return fn() memoized for ttl seconds under key"""
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = fn()
+    _CACHE[key] = (now, value)
+    return value
+
+def _env_int(name, default):
+    """Read an integer setting from the environment, ignoring malformed values"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+# Poll cadence; raise these on battery-sensitive machines
+CCC_POLL_INTERVAL_MS = _env_int("CCC_POLL_INTERVAL_MS", 3000)
+CCC_GPU_POLL_TICKS = max(1, _env_int("CCC_GPU_POLL_TICKS", 2))
+
+HELPER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'lcc_helper.py')
+
+class PrivilegedHelper:
+    """One pkexec-authorized writer process shared by every privileged sysfs write"""
+    def __init__(self, script=HELPER_SCRIPT):
+        self.script = script
+        self.proc = None
+        # Set once the helper has answered; until then the polkit prompt may be up
+        self.authorized = False
+        # Writes may come from several background tasks; one request/reply at a time
+        self.lock = threading.Lock()
+        atexit.register(self.stop)
+    
+    def start(self):
+        self.proc = subprocess.Popen(['pkexec', sys.executable, self.script],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        self.authorized = False
+    
+    def stop(self, timeout=2):
+        """Ask the helper to exit by closing its stdin; it runs as root, so it cannot be signalled"""
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=timeout)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                print(f"Privileged helper did not exit: {e}")
+            # A wedged helper is left behind; the next write starts a fresh one
+            self.proc = None
+    
+    def write(self, path, value, timeout=None):
+        """Write one value, authorizing on first use; raises CalledProcessError on failure"""
+        with self.lock:
+            self.write_locked(path, value, timeout)
+    
+    def write_locked(self, path, value, timeout):
+        if self.proc is None or self.proc.poll() is not None:
+            self.start()
+        args = self.proc.args
+        try:
+            self.proc.stdin.write(f"{path} {value}\n")
+            self.proc.stdin.flush()
+            # The first reply waits on the user authenticating, so it is not timed
+            wait = timeout if self.authorized else None
+            if not select.select([self.proc.stdout], [], [], wait)[0]:
+                self.stop()
+                raise subprocess.TimeoutExpired(args, timeout)
+            reply = self.proc.stdout.readline().strip()
+            if reply:
+                self.authorized = True
+        except BrokenPipeError:
+            reply = ""
+        if reply == "ok":
+            return
+        if not reply:
+            # Authorization was dismissed or the helper died; next write starts a new one
+            returncode = self.proc.wait()
+            self.proc = None
+            raise subprocess.CalledProcessError(returncode, args, stderr="Authorization failed")
+        raise subprocess.CalledProcessError(1, args, stderr=reply.partition("error: ")[2] or reply)
+    
+    def write_each(self, writes, timeout=None):
+        """Attempt every write under the one authorization; returns each error message or None"""
+        errors = []
+        with self.lock:
+            for path, value in writes:
+                try:
+                    self.write_locked(path, value, timeout)
+                    errors.append(None)
+                except subprocess.CalledProcessError as e:
+                    if self.proc is None:
+                        # Authorization failed; nothing after this can succeed either
+                        raise
+                    errors.append(e.stderr)
+        return errors
+
+PRIVILEGED_HELPER = PrivilegedHelper()
+
+def pkexec_write_batch(writes, timeout=None):
+    """Apply (path, value) writes in order under a single authorization"""
+    if os.path.exists(HELPER_SCRIPT):
+        for path, value in writes:
+            PRIVILEGED_HELPER.write(path, value, timeout)
+        return
+    values = {str(value) for _, value in writes}
+    if len(values) == 1:
+        # Without the helper, a single value goes to every path through tee: no shell
+        subprocess.run(['pkexec', 'tee'] + [path for path, _ in writes], input=f"{values.pop()}\n",
+                       text=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout, check=True)
+        return
+    # Differing values need one pkexec'd shell; paths and values travel as positional
+    # arguments, never as part of the script
+    args = [str(item) for write in writes for item in write]
+    subprocess.run(['pkexec', 'sh', '-c',
+                    'while [ $# -gt 1 ]; do printf "%s\\n" "$2" > "$1" || exit 1; shift 2; done',
+                    'sh'] + args,
+                   text=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout, check=True)
+
+def pkexec_write_each(writes, timeout=None):
+    """Like pkexec_write_batch, but attempt every write and return a per-write error or None"""
+    if os.path.exists(HELPER_SCRIPT):
+        return PRIVILEGED_HELPER.write_each(writes, timeout)
+    args = [str(item) for write in writes for item in write]
+    result = subprocess.run(['pkexec', 'sh', '-c',
+                             'while [ $# -gt 1 ]; do if { printf "%s\\n" "$2" > "$1"; } 2>/dev/null; '
+                             'then echo ok; else echo "error: write failed"; fi; shift 2; done',
+                             'sh'] + args,
+                            text=True, capture_output=True, timeout=timeout, check=True)
+    replies = result.stdout.splitlines()
+    return [None if reply == "ok" else reply.partition("error: ")[2] for reply in replies]
+
+def pkexec_write(paths, value, timeout=None):
+    """Write value to one or more root-owned sysfs paths through the privileged helper"""
+    if isinstance(paths, str):
+        paths = [paths]
+    pkexec_write_batch([(path, value) for path in paths], timeout)
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(object, object)  # result, exception
+
+class BackgroundTask(QRunnable):
+    """Run a blocking call (pkexec, polkit prompts) on the thread pool"""
+    # Keep the Python wrappers alive until their result has been delivered
+    running = set()
+    
+    def __init__(self, fn, callback):
+        super().__init__()
+        self.fn = fn
+        self.callback = callback
+        self.signals = TaskSignals()
+        # The signals object lives on the GUI thread, so the callback runs there
+        self.signals.finished.connect(self.deliver)
+    
+    def run(self):
+        try:
+            result, error = self.fn(), None
+        except Exception as e:
+            result, error = None, e
+        self.signals.finished.emit(result, error)
+    
+    def deliver(self, result, error):
+        BackgroundTask.running.discard(self)
+        self.callback(result, error)
+
+def run_in_background(fn, callback):
+    """Call fn off the GUI thread, then callback(result, error) back on it"""
+    task = BackgroundTask(fn, callback)
+    task.setAutoDelete(False)
+    BackgroundTask.running.add(task)
+    QThreadPool.globalInstance().start(task)
+
+class SysfsAttribute:
+    """A sysfs attribute kept open and re-read with a single pread() per refresh"""
+    def __init__(self, path):
+        self.path = path
+        try:
+            self.fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            self.fd = None
+    
+    def read(self, size=64):
+        """Return the stripped attribute text, or None if it cannot be read"""
+        if self.fd is None:
+            return None
+        try:
+            return os.pread(self.fd, size, 0).strip().decode()
+        except OSError:
+            return None
+    
+    def read_int(self, size=32):
+        """Return the attribute as an int parsed straight from the bytes, or None"""
+        if self.fd is None:
+            return None
+        try:
+            return int(os.pread(self.fd, size, 0))
+        except (OSError, ValueError):
+            return None
+    
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+    
+    def __del__(self):
+        self.close()
+
+BatteryStatus = namedtuple('BatteryStatus', 'percent secsleft power_plugged')
+
+class BatteryReader:
+    """psutil.sensors_battery() over held-open sysfs attributes, one pread each per refresh"""
+    POWER_SUPPLY = '/sys/class/power_supply'
+    
+    def __init__(self):
+        bats = [name for name in os.listdir(self.POWER_SUPPLY)
+                if name.startswith('BAT') or 'battery' in name.lower()] if os.path.isdir(self.POWER_SUPPLY) else []
+        self.available = bool(bats)
+        if not self.available:
+            return
+        root = os.path.join(self.POWER_SUPPLY, min(bats))
+        # The same quantity is exposed under different names depending on the driver
+        self.energy_now = self.open_first(f'{root}/energy_now', f'{root}/charge_now')
+        self.power_now = self.open_first(f'{root}/power_now', f'{root}/current_now')
+        self.energy_full = self.open_first(f'{root}/energy_full', f'{root}/charge_full')
+        self.capacity = self.open_first(f'{root}/capacity')
+        self.status = self.open_first(f'{root}/status')
+        self.ac_online = self.open_first(f'{self.POWER_SUPPLY}/AC0/online', f'{self.POWER_SUPPLY}/AC/online')
+    
+    @staticmethod
+    def open_first(*paths):
+        for path in paths:
+            attr = SysfsAttribute(path)
+            if attr.fd is not None:
+                return attr
+        return None
+    
+    @staticmethod
+    def read_int(attr):
+        return attr.read_int() if attr else None
+    
+    def read(self):
+        """Return a BatteryStatus shaped like psutil's, or None without a battery"""
+        if not self.available:
+            return None
+        energy_now = self.read_int(self.energy_now)
+        power_now = self.read_int(self.power_now)
+        energy_full = self.read_int(self.energy_full)
+        
+        if energy_now is not None and energy_full:
+            percent = 100.0 * energy_now / energy_full
+        else:
+            percent = self.read_int(self.capacity)
+            if percent is None:
+                return None
+        
+        online = self.read_int(self.ac_online)
+        if online is not None:
+            power_plugged = online == 1
+        else:
+            status = (self.status.read() if self.status else "") or ""
+            power_plugged = {'discharging': False, 'charging': True, 'full': True}.get(status.lower())
+        
+        if power_plugged:
+            secsleft = psutil.POWER_TIME_UNLIMITED
+        elif energy_now is not None and power_now:
+            secsleft = int(energy_now / abs(power_now) * 3600)
+        else:
+            secsleft = psutil.POWER_TIME_UNKNOWN
+        return BatteryStatus(percent, secsleft, power_plugged)
+    
+    def read_cached(self, ttl=2.0):
+        """read(), shared by every consumer that asks within ttl seconds"""
+        return _cached('sensors_battery', ttl, self.read)
+
+class XRandrBrightness:
+    """Software brightness via RandR CRTC gamma, equivalent to xrandr --brightness"""
+    def __init__(self):
+        self.display = xdisplay.Display()
+        root = self.display.screen().root
+        resources = root.xrandr_get_screen_resources_current()
+        primary = root.xrandr_get_output_primary().output
+        
+        # Prefer the primary output, otherwise the first one driving a CRTC
+        self.crtc = None
+        for output in ([primary] if primary else []) + list(resources.outputs):
+            info = self.display.xrandr_get_output_info(output, resources.config_timestamp)
+            if info.crtc:
+                self.crtc = info.crtc
+                break
+        if self.crtc is None:
+            raise RuntimeError("No active RandR output found")
+        
+        self.gamma_size = self.display.xrandr_get_crtc_gamma_size(self.crtc).size
+    
+    def set_brightness(self, value):
+        """Apply a linear gamma ramp scaled by value (0.0-1.0)"""
+        step = 65535 / max(1, self.gamma_size - 1)
+        ramp = [min(65535, int(i * step * value)) for i in range(self.gamma_size)]
+        self.display.xrandr_set_crtc_gamma(self.crtc, self.gamma_size, ramp, ramp, ramp)
+        self.display.sync()
 
 class GPUController:
+    # nvidia-smi query fields and the gpu_info keys they fill
+    NVIDIA_STATIC_FIELDS = ('name', 'memory.total')
+    NVIDIA_VOLATILE_FIELDS = ('temperature.gpu', 'utilization.gpu', 'memory.used')
+    NVIDIA_FIELD_KEYS = {
+        'name': 'name',
+        'memory.total': 'memory_total',
+        'temperature.gpu': 'temperature',
+        'utilization.gpu': 'usage',
+        'memory.used': 'memory_used',
+    }
+    
     def __init__(self):
         self.gpu_info = {}
+        self.nv_handle = None
+        self.nvsmi_proc = None
+        self.nvsmi_buffer = b''
+        # Set while polling is parked and the sampling nvidia-smi was stopped for it
+        self.nvsmi_paused = False
+        # Consecutive query failures and the monotonic time polling resumes after them
+        self.fail_count = 0
+        self.disabled_until = 0
         self.detect_gpu()
 
     def detect_gpu(self):
         """Detect GPU and its properties"""
-        if shutil.which('nvidia-smi'):
+        if self.init_nvml() or shutil.which('nvidia-smi'):
             self.gpu_info['vendor'] = 'NVIDIA'
-            self.update_nvidia_info()
+            self.probe_static_nvidia_info()
+            if self.nv_handle is None:
+                self.start_nvidia_smi()
+                atexit.register(self.stop_nvidia_smi)
         elif os.path.exists('/sys/class/drm/card0/device/vendor') and \
              os.path.exists('/sys/class/drm/card0/device/power_dpm_force_performance_level'):
             self.gpu_info['vendor'] = 'AMD'
+            self.open_amd_attributes()
             self.update_amd_info()
         else:
             self.gpu_info['vendor'] = 'Intel' # or other
             self.update_intel_info()
 
+    def init_nvml(self):
+        """Initialize NVML once and keep the first device handle for polling"""
+        if pynvml is None:
+            return False
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError as e:
+            print(f"NVML unavailable, using nvidia-smi: {e}")
+            return False
+        try:
+            self.nv_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        except pynvml.NVMLError as e:
+            print(f"No NVML device found: {e}")
+            pynvml.nvmlShutdown()
+            return False
+        atexit.register(pynvml.nvmlShutdown)
+        return True
+
+    def probe_static_nvidia_info(self):
+        """Read the name and total memory once, together with a first sample"""
+        if self.nv_handle is None:
+            self.query_nvidia_smi(self.NVIDIA_STATIC_FIELDS + self.NVIDIA_VOLATILE_FIELDS)
+            return
+        try:
+            name = pynvml.nvmlDeviceGetName(self.nv_handle)
+            self.gpu_info['name'] = name.decode() if isinstance(name, bytes) else name
+        except pynvml.NVMLError as e:
+            print(f"Could not get NVIDIA info: {e}")
+        self.update_nvml_info()
+
+    def update_nvml_info(self):
+        handle = self.nv_handle
+        try:
+            self.gpu_info['temperature'] = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            self.gpu_info['usage'] = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+            memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            # Report MiB, matching what nvidia-smi returns with nounits
+            self.gpu_info['memory_total'] = memory.total // (1024 * 1024)
+            self.gpu_info['memory_used'] = memory.used // (1024 * 1024)
+            self.record_success()
+        except pynvml.NVMLError as e:
+            print(f"Could not get NVIDIA info: {e}")
+            self.record_failure()
+
+    def start_nvidia_smi(self):
+        """Launch one nvidia-smi that keeps sampling instead of forking it per poll"""
+        try:
+            self.nvsmi_proc = subprocess.Popen(
+                ['nvidia-smi', f"--query-gpu={','.join(self.NVIDIA_VOLATILE_FIELDS)}",
+                 '--format=csv,noheader,nounits', '-i', '0', '-lms', '2000'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            print(f"Could not start nvidia-smi: {e}")
+            return
+        os.set_blocking(self.nvsmi_proc.stdout.fileno(), False)
+    
+    def stop_nvidia_smi(self):
+        """Terminate the sampling nvidia-smi child"""
+        if self.nvsmi_proc is not None:
+            self.nvsmi_proc.terminate()
+            self.nvsmi_proc.wait()
+            self.nvsmi_proc = None
+            self.nvsmi_buffer = b''
+    
+    def pause_sampling(self):
+        """Stop nvidia-smi while nobody polls, so it neither piles up stale samples nor blocks on a full pipe"""
+        if self.nvsmi_proc is not None:
+            self.stop_nvidia_smi()
+            self.nvsmi_paused = True
+    
+    def resume_sampling(self):
+        """Restart the nvidia-smi stopped by pause_sampling"""
+        if self.nvsmi_paused:
+            self.nvsmi_paused = False
+            self.start_nvidia_smi()
+    
+    def read_nvidia_smi_line(self):
+        """Return the newest complete line nvidia-smi has printed, or None"""
+        fd = self.nvsmi_proc.stdout.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                # nvidia-smi exited; fall back to one-shot queries
+                self.stop_nvidia_smi()
+                break
+            self.nvsmi_buffer += chunk
+        *lines, self.nvsmi_buffer = self.nvsmi_buffer.split(b'\n')
+        lines = [line for line in lines if line.strip()]
+        return lines[-1].decode() if lines else None
+    
     def update_nvidia_info(self):
+        if self.nv_handle is not None:
+            self.update_nvml_info()
+            return
+        
+        if self.nvsmi_proc is not None:
+            line = self.read_nvidia_smi_line()
+            if line is not None:
+                self.parse_nvidia_csv(line, self.NVIDIA_VOLATILE_FIELDS)
+            return
+        
+        self.query_nvidia_smi(self.NVIDIA_VOLATILE_FIELDS)
+    
+    def query_nvidia_smi(self, fields):
+        """Run nvidia-smi once for the given query fields"""
         try:
             result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=name,temperature.gpu,utilization.gpu,memory.total,memory.used', '--format=csv,noheader,nounits'],
+                ['nvidia-smi', f"--query-gpu={','.join(fields)}", '--format=csv,noheader,nounits', '-i', '0'],
                 capture_output=True, text=True, check=True
             )
-            values = result.stdout.strip().split(', ')
-            self.gpu_info['name'] = values[0]
-            
+            self.parse_nvidia_csv(result.stdout, fields)
+            self.record_success()
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"Could not get NVIDIA info: {e}")
+            self.record_failure()
+    
+    def parse_nvidia_csv(self, line, fields):
+        """Parse one nvidia-smi CSV sample of the given fields into gpu_info"""
+        values = next(csv.reader([line.strip()], skipinitialspace=True), [])
+        for i, field in enumerate(fields):
+            key = self.NVIDIA_FIELD_KEYS[field]
+            value = values[i] if i < len(values) else '[N/A]'
+            if field == 'name':
+                self.gpu_info[key] = value
+                continue
             # Handle N/A values safely
             try:
-                self.gpu_info['temperature'] = int(values[1]) if values[1] != '[N/A]' else 0
-            except (ValueError, IndexError):
-                self.gpu_info['temperature'] = 0
-                
-            try:
-                self.gpu_info['usage'] = int(values[2]) if values[2] != '[N/A]' else 0
-            except (ValueError, IndexError):
-                self.gpu_info['usage'] = 0
-                
-            try:
-                self.gpu_info['memory_total'] = int(values[3]) if values[3] != '[N/A]' else 0
-            except (ValueError, IndexError):
-                self.gpu_info['memory_total'] = 0
-                
-            try:
-                self.gpu_info['memory_used'] = int(values[4]) if values[4] != '[N/A]' else 0
-            except (ValueError, IndexError):
-                self.gpu_info['memory_used'] = 0
-                
-        except (subprocess.CalledProcessError, FileNotFoundError, IndexError) as e:
-            print(f"Could not get NVIDIA info: {e}")
+                self.gpu_info[key] = int(value)
+            except ValueError:
+                self.gpu_info[key] = 0
 
+    def open_amd_attributes(self):
+        """Resolve the AMD sysfs nodes once and keep them open for polling"""
+        device = '/sys/class/drm/card0/device'
+        temp_files = glob.glob(f'{device}/hwmon/hwmon*/temp1_input')
+        self.amd_attrs = {
+            'temperature': SysfsAttribute(temp_files[0]) if temp_files else None,
+            'usage': SysfsAttribute(f'{device}/gpu_busy_percent'),
+            'performance_level': SysfsAttribute(f'{device}/power_dpm_force_performance_level'),
+        }
+    
     def update_amd_info(self):
-        try:
-            # Temperature
-            temp_files = glob.glob('/sys/class/drm/card0/device/hwmon/hwmon*/temp1_input')
-            if temp_files:
-                with open(temp_files[0], 'r') as f:
-                    self.gpu_info['temperature'] = int(f.read().strip()) / 1000
-            else:
-                self.gpu_info['temperature'] = 0
-            
-            # Usage
-            if os.path.exists('/sys/class/drm/card0/device/gpu_busy_percent'):
-                with open('/sys/class/drm/card0/device/gpu_busy_percent', 'r') as f:
-                    self.gpu_info['usage'] = int(f.read().strip())
-            else:
-                self.gpu_info['usage'] = 0
-            
-            # Power DPM performance level
-            if os.path.exists('/sys/class/drm/card0/device/power_dpm_force_performance_level'):
-                with open('/sys/class/drm/card0/device/power_dpm_force_performance_level', 'r') as f:
-                    self.gpu_info['performance_level'] = f.read().strip()
-            else:
-                self.gpu_info['performance_level'] = 'N/A'
-                
-        except (FileNotFoundError, IndexError, ValueError) as e:
-            print(f"Could not get AMD info: {e}")
-            self.gpu_info['temperature'] = 0
-            self.gpu_info['usage'] = 0
-            self.gpu_info['performance_level'] = 'N/A'
+        # Temperature
+        temp_attr = self.amd_attrs['temperature']
+        temp = temp_attr.read_int() if temp_attr else None
+        self.gpu_info['temperature'] = temp / 1000 if temp else 0
+        
+        # Usage
+        usage = self.amd_attrs['usage'].read_int()
+        self.gpu_info['usage'] = usage or 0
+        
+        # Power DPM performance level
+        self.gpu_info['performance_level'] = self.amd_attrs['performance_level'].read() or 'N/A'
+        
+        if temp is None and usage is None:
+            self.record_failure()
+        else:
+            self.record_success()
 
     def update_intel_info(self):
         # Intel GPU info is harder to get, placeholder
@@ -103,7 +564,19 @@ class GPUController:
         self.gpu_info['temperature'] = "N/A"
         self.gpu_info['usage'] = "N/A"
 
+    def record_failure(self):
+        """Back off exponentially (up to an hour) after a failed GPU query"""
+        self.fail_count += 1
+        self.disabled_until = time.monotonic() + min(2 ** self.fail_count, 3600)
+    
+    def record_success(self):
+        self.fail_count = 0
+        self.disabled_until = 0
+    
     def get_gpu_info(self):
+        # A powered-down or missing GPU keeps failing; don't retry it every tick
+        if time.monotonic() < self.disabled_until:
+            return self.gpu_info
         if self.gpu_info.get('vendor') == 'NVIDIA':
             self.update_nvidia_info()
         elif self.gpu_info.get('vendor') == 'AMD':
@@ -119,27 +592,72 @@ class GPUController:
             return False, f"Invalid performance level. Valid levels are: {valid_levels}"
 
         try:
-            cmd = f"echo {level} | pkexec tee /sys/class/drm/card0/device/power_dpm_force_performance_level"
-            subprocess.run(cmd, shell=True, check=True)
+            pkexec_write('/sys/class/drm/card0/device/power_dpm_force_performance_level', level)
             return True, f"AMD performance level set to {level}"
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             return False, f"Failed to set AMD performance level: {e}"
 
+_FAN_INPUT_RE = re.compile(r'fan(\d+)_input$')
+_PWM_RE = re.compile(r'pwm(\d+)$')
+_RPM_RE = re.compile(r'(\d+)\s*RPM')
+
+# PWM duty cycle (0-255) to the percentage shown in the UI, precomputed once
+_PWM_PCT = tuple(round((pwm / 255) * 100) for pwm in range(256))
+
+# hwmon pwmN_enable values: 1 takes manual PWM writes, 2 hands control to the
+# chip's automatic mode (0 would mean no control, i.e. full speed)
+PWM_ENABLE_VALUES = {'manual': 1, 'automatic': 2}
+
 class FanController:
     def __init__(self):
         self.fan_info = {}
         self.controllable_fans = {}
         self.pwm_paths = {}
+        self.pwm_attrs = {}
+        self.hwmon_fans = []
+        self.hwmon_pwms = []
+        self.fan_attrs = {}
+        self.fan_readers = []
+        # sensors_fans() only exists on Linux/FreeBSD and is empty without fan hwmon entries
+        self.psutil_fans_available = hasattr(psutil, 'sensors_fans')
+        self.scan_hwmon()
         self.detect_fans()
         self.detect_controllable_fans()
     
+    def scan_hwmon(self):
+        """Resolve hwmon fan inputs and PWM controls once; polling only re-reads them"""
+        for hwmon_path in sorted(glob.glob('/sys/class/hwmon/hwmon*')):
+            device_name = SysfsAttribute(f"{hwmon_path}/name").read() or "Unknown"
+            for fan_input in glob.glob(f"{hwmon_path}/fan*_input"):
+                match = _FAN_INPUT_RE.search(fan_input)
+                if match:
+                    attr = SysfsAttribute(fan_input)
+                    self.hwmon_fans.append((device_name, match.group(1), attr))
+                    self.fan_attrs[fan_input] = attr
+            for pwm_file in glob.glob(f"{hwmon_path}/pwm*"):
+                match = _PWM_RE.search(pwm_file)
+                if match:
+                    pwm_num = match.group(1)
+                    self.hwmon_pwms.append((device_name, pwm_num, SysfsAttribute(pwm_file),
+                                            f"{hwmon_path}/pwm{pwm_num}_enable"))
+    
+    def close(self):
+        """Close the cached hwmon attribute descriptors"""
+        for _, _, attr in self.hwmon_fans:
+            attr.close()
+        for _, _, attr, _ in self.hwmon_pwms:
+            attr.close()
+    
     def detect_fans(self):
         """Detect all available fans using multiple methods"""
         fans = {}
         
-        # Method 1: psutil sensors
+        # Method 1: psutil sensors (skipped for good once it has come back empty)
         try:
-            psutil_fans = psutil.sensors_fans()
+            psutil_fans = {}
+            if self.psutil_fans_available:
+                psutil_fans = _cached('sensors_fans', 5, psutil.sensors_fans)
+                self.psutil_fans_available = bool(psutil_fans)
             for name, fan_list in psutil_fans.items():
                 for i, fan in enumerate(fan_list):
                     if fan.current > 0:
@@ -153,139 +671,109 @@ class FanController:
             print(f"psutil fan detection failed: {e}")
         
         # Method 2: /sys/class/hwmon
-        try:
-            hwmon_paths = glob.glob('/sys/class/hwmon/hwmon*')
-            for hwmon_path in hwmon_paths:
-                try:
-                    # Check for fan inputs
-                    fan_inputs = glob.glob(f"{hwmon_path}/fan*_input")
-                    for fan_input in fan_inputs:
-                        fan_num = re.search(r'fan(\d+)_input', fan_input).group(1)
-                        try:
-                            with open(fan_input, 'r') as f:
-                                rpm = int(f.read().strip())
-                            if rpm > 0:
-                                # Get fan name if available
-                                name_file = f"{hwmon_path}/name"
-                                device_name = "Unknown"
-                                if os.path.exists(name_file):
-                                    with open(name_file, 'r') as f:
-                                        device_name = f.read().strip()
-                                
-                                fan_key = f"{device_name}_fan{fan_num}"
-                                fans[fan_key] = {
-                                    'name': f"{device_name} Fan {fan_num}",
-                                    'rpm': rpm,
-                                    'source': 'hwmon',
-                                    'path': fan_input
-                                }
-                        except (ValueError, IOError):
-                            continue
-                except Exception:
-                    continue
-        except Exception as e:
-            print(f"hwmon fan detection failed: {e}")
+        for device_name, fan_num, attr in self.hwmon_fans:
+            rpm = attr.read_int() or 0
+            if rpm > 0:
+                fan_key = f"{device_name}_fan{fan_num}"
+                fans[fan_key] = {
+                    'name': f"{device_name} Fan {fan_num}",
+                    'rpm': rpm,
+                    'source': 'hwmon',
+                    'path': attr.path
+                }
+        
+        # Method 3: lm-sensors via subprocess, only when sysfs found nothing
+        if not fans:
+            try:
+                result = subprocess.run(['sensors', '-A'], capture_output=True, text=True, timeout=2)
+                if result.returncode == 0:
+                    current_device = None
+                    for line in result.stdout.split('\n'):
+                        line = line.strip()
+                        if line and not line.startswith(' ') and ':' not in line:
+                            current_device = line
+                        elif 'fan' in line.lower() and 'rpm' in line.lower():
+                            try:
+                                parts = line.split(':')
+                                if len(parts) >= 2:
+                                    fan_name = parts[0].strip()
+                                    rpm_part = parts[1].strip()
+                                    rpm_match = _RPM_RE.search(rpm_part)
+                                    if rpm_match:
+                                        rpm = int(rpm_match.group(1))
+                                        if rpm > 0:
+                                            fan_key = f"{current_device}_{fan_name}"
+                                            fans[fan_key] = {
+                                                'name': f"{current_device} {fan_name}",
+                                                'rpm': rpm,
+                                                'source': 'lm-sensors',
+                                                'path': None
+                                            }
+                            except Exception:
+                                continue
+            except Exception as e:
+                print(f"lm-sensors fan detection failed: {e}")
         
-        # Method 3: lm-sensors via subprocess
-        try:
-            result = subprocess.run(['sensors', '-A'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                current_device = None
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith(' ') and ':' not in line:
-                        current_device = line
-                    elif 'fan' in line.lower() and 'rpm' in line.lower():
-                        try:
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                fan_name = parts[0].strip()
-                                rpm_part = parts[1].strip()
-                                rpm_match = re.search(r'(\d+)\s*RPM', rpm_part)
-                                if rpm_match:
-                                    rpm = int(rpm_match.group(1))
-                                    if rpm > 0:
-                                        fan_key = f"{current_device}_{fan_name}"
-                                        fans[fan_key] = {
-                                            'name': f"{current_device} {fan_name}",
-                                            'rpm': rpm,
-                                            'source': 'lm-sensors',
-                                            'path': None
-                                        }
-                        except Exception:
-                            continue
-        except Exception as e:
-            print(f"lm-sensors fan detection failed: {e}")
         
         self.fan_info = fans
+        # Flat (key, attribute, last rpm) rows so the per-tick read skips the dict lookups
+        self.fan_readers = [(key, self.fan_attrs.get(info['path']), info['rpm']) for key, info in fans.items()]
         return fans
     
     def detect_controllable_fans(self):
         """Detect which fans can be controlled"""
         controllable = {}
         
-        # Look for PWM controls in /sys/class/hwmon
-        try:
-            hwmon_paths = glob.glob('/sys/class/hwmon/hwmon*')
-            for hwmon_path in hwmon_paths:
-                try:
-                    pwm_files = glob.glob(f"{hwmon_path}/pwm*")
-                    for pwm_file in pwm_files:
-                        if pwm_file.endswith('_enable') or pwm_file.endswith('_mode'):
-                            continue
-                        
-                        pwm_num = re.search(r'pwm(\d+)$', pwm_file).group(1)
-                        pwm_enable_file = f"{hwmon_path}/pwm{pwm_num}_enable"
-                        
-                        # Check if PWM is writable and enabled
-                        if os.access(pwm_file, os.W_OK) or True:  # We'll use pkexec for writes
-                            try:
-                                with open(pwm_file, 'r') as f:
-                                    current_pwm = int(f.read().strip())
-                                
-                                # Get device name
-                                name_file = f"{hwmon_path}/name"
-                                device_name = "Unknown"
-                                if os.path.exists(name_file):
-                                    with open(name_file, 'r') as f:
-                                        device_name = f.read().strip()
-                                
-                                fan_key = f"{device_name}_pwm{pwm_num}"
-                                controllable[fan_key] = {
-                                    'name': f"{device_name} PWM {pwm_num}",
-                                    'pwm_path': pwm_file,
-                                    'pwm_enable_path': pwm_enable_file,
-                                    'current_pwm': current_pwm,
-                                    'max_pwm': 255
-                                }
-                                
-                                # Store PWM paths for easy access
-                                self.pwm_paths[fan_key] = pwm_file
-                                
-                            except (ValueError, IOError):
-                                continue
-                except Exception:
-                    continue
-        except Exception as e:
-            print(f"PWM detection failed: {e}")
+        # PWM controls found by scan_hwmon; writes go through pkexec
+        for device_name, pwm_num, attr, pwm_enable_file in self.hwmon_pwms:
+            current_pwm = attr.read_int()
+            if current_pwm is None:
+                continue
+            
+            fan_key = f"{device_name}_pwm{pwm_num}"
+            controllable[fan_key] = {
+                'name': f"{device_name} PWM {pwm_num}",
+                'pwm_path': attr.path,
+                'pwm_enable_path': pwm_enable_file,
+                'current_pwm': current_pwm,
+                'max_pwm': 255
+            }
+            
+            # Store PWM paths for easy access
+            self.pwm_paths[fan_key] = attr.path
+            self.pwm_attrs[fan_key] = attr
         
         self.controllable_fans = controllable
         return controllable
     
+    def refresh_pwm_values(self, skip=()):
+        """Re-read the current duty cycle of the known PWM controls not listed in skip"""
+        for fan_key in self.controllable_fans.keys() - skip:
+            if not self.refresh_pwm_value(fan_key):
+                # Unreadable now, e.g. its hwmon device is gone; re-detection brings it back
+                del self.controllable_fans[fan_key]
+    
+    def refresh_pwm_value(self, fan_key):
+        """Re-read one PWM control; the read also re-arms its sysfs POLLPRI notification"""
+        attr = self.pwm_attrs.get(fan_key)
+        current_pwm = attr.read_int() if attr is not None else None
+        fan = self.controllable_fans.get(fan_key)
+        if current_pwm is None or fan is None:
+            return False
+        fan['current_pwm'] = current_pwm
+        return True
+    
     def get_current_fan_speeds(self):
         """Get current fan speeds for all detected fans"""
         current_speeds = {}
         
-        for fan_key, fan_info in self.fan_info.items():
-            try:
-                if fan_info['source'] == 'hwmon' and fan_info['path']:
-                    with open(fan_info['path'], 'r') as f:
-                        rpm = int(f.read().strip())
-                        current_speeds[fan_key] = rpm
-                else:
-                    current_speeds[fan_key] = fan_info['rpm']
-            except Exception:
-                current_speeds[fan_key] = 0
+        for fan_key, attr, rpm in self.fan_readers:
+            if attr is not None:
+                rpm = attr.read_int()
+                if rpm is None:
+                    # The node went away with its device; leave the fan out
+                    continue
+            current_speeds[fan_key] = rpm
         
         return current_speeds
     
@@ -311,17 +799,15 @@ class FanController:
                 return False, f"PWM control file not found: {fan_info['pwm_path']}"
             
             # Use pkexec to write PWM value
-            cmd = f"echo {pwm_value} | pkexec tee {fan_info['pwm_path']}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
+            pkexec_write(fan_info['pwm_path'], pwm_value, timeout=10)
             
-            if result.returncode == 0:
-                # Update cached value
-                self.controllable_fans[fan_key]['current_pwm'] = pwm_value
-                return True, f"Fan speed set to {speed_percent}%"
-            else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                return False, f"Failed to set fan speed: {error_msg}"
+            # Update cached value
+            self.controllable_fans[fan_key]['current_pwm'] = pwm_value
+            return True, f"Fan speed set to {speed_percent}%"
                 
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.strip() if e.stderr else "Unknown error"
+            return False, f"Failed to set fan speed: {error_msg}"
         except subprocess.TimeoutExpired:
             return False, "Timeout: Fan speed change took too long"
         except Exception as e:
@@ -348,7 +834,7 @@ class FanController:
             return False, f"Cannot determine system temperature: {str(e)}"
     
     def set_fan_mode(self, fan_key, mode):
-        """Set fan mode (automatic=1, manual=0)"""
+        """Set fan mode ('automatic' or 'manual')"""
         if fan_key not in self.controllable_fans:
             return False, "Fan not controllable"
         
@@ -359,23 +845,49 @@ class FanController:
             if not os.path.exists(enable_path):
                 return False, "Fan mode control not available"
             
-            mode_value = 1 if mode == 'automatic' else 0
-            cmd = f"echo {mode_value} | pkexec tee {enable_path}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return True, f"Fan mode set to {mode}"
-            else:
-                return False, f"Failed to set fan mode: {result.stderr}"
+            pkexec_write(enable_path, PWM_ENABLE_VALUES[mode])
+            return True, f"Fan mode set to {mode}"
+        except subprocess.CalledProcessError as e:
+            return False, f"Failed to set fan mode: {e.stderr}"
         except Exception as e:
             return False, f"Error setting fan mode: {str(e)}"
 
+    def set_fan_modes(self, fan_keys, mode):
+        """Set the mode of several fans under one authorization; returns (successes, error messages)"""
+        mode_value = PWM_ENABLE_VALUES[mode]
+        writes, targets, error_messages = [], [], []
+        for fan_key in fan_keys:
+            fan_info = self.controllable_fans.get(fan_key)
+            if fan_info is None:
+                error_messages.append(f"{fan_key}: Fan not controllable")
+            elif not os.path.exists(fan_info['pwm_enable_path']):
+                error_messages.append(f"{fan_key}: Fan mode control not available")
+            else:
+                writes.append((fan_info['pwm_enable_path'], mode_value))
+                targets.append(fan_key)
+        
+        if not writes:
+            return 0, error_messages
+        try:
+            errors = pkexec_write_each(writes)
+        except subprocess.CalledProcessError as e:
+            error = e.stderr.strip() if e.stderr else "Unknown error"
+            return 0, error_messages + [f"Failed to set fan mode: {error}"]
+        except Exception as e:
+            return 0, error_messages + [f"Error setting fan mode: {str(e)}"]
+        
+        for fan_key, error in zip(targets, errors):
+            if error is not None:
+                error_messages.append(f"{fan_key}: Failed to set fan mode: {error}")
+        return errors.count(None), error_messages
+
 class GPUControlWidget(QWidget):
     def __init__(self, gpu_controller):
         super().__init__()
         self.gpu_controller = gpu_controller
         self.init_ui()
-        self.update_gpu_info()
+        # Querying the GPU may spawn nvidia-smi; let the tab paint first
+        QTimer.singleShot(0, self.update_gpu_info)
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -438,42 +950,180 @@ class GPUControlWidget(QWidget):
 
     def apply_amd_performance_level(self):
         level = self.amd_power_level_combo.currentText()
-        success, message = self.gpu_controller.set_amd_performance_level(level)
+        run_in_background(lambda: self.gpu_controller.set_amd_performance_level(level),
+                          self.on_amd_performance_level_applied)
+    
+    def on_amd_performance_level_applied(self, result, error):
+        success, message = result if error is None else (False, f"Unexpected error: {error}")
         if success:
             QMessageBox.information(self, "Success", message)
         else:
             QMessageBox.critical(self, "Error", message)
 
-class SystemInfoThread(QThread):
-    data_updated = pyqtSignal(dict)
+BATTERY_READER = BatteryReader()
+
+class SystemStatsBus(QObject):
+    """Single poll source shared by every tab that shows live system data"""
+    snapshot_ready = pyqtSignal(dict)
+    thresholds_ready = pyqtSignal(dict)
+    
+    # Everything runs off one QTimer; slower metrics refresh every Nth tick
+    POLL_INTERVAL_MS = CCC_POLL_INTERVAL_MS
+    GPU_POLL_TICKS = CCC_GPU_POLL_TICKS
+    THRESHOLD_POLL_TICKS = 5
+    # The Power tab refreshes PWM duty cycles only while it is shown, so the
+    # System Info tab's "Controllable Fans" rows are kept current from here
+    PWM_POLL_TICKS = 2
+    
+    # Collectors whose values move slowly: (refresh every N ticks, collector)
+    SLOW_COLLECTORS = {
+        'temperatures': (2, psutil.sensors_temperatures),
+        'battery': (5, lambda: BATTERY_READER.read_cached()),
+        'disk': (10, lambda: psutil.disk_usage('/')),
+    }
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
     def __init__(self):
         super().__init__()
+        
+        # Hardware detection can shell out (lm-sensors, nvidia-smi), so it runs once
+        # the event loop is up instead of delaying the first paint of the window
+        self.fan_controller = None
+        self.gpu_controller = None
+        QTimer.singleShot(0, self.detect_hardware)
+        
+        # Prime psutil so later non-blocking calls return the delta since the last tick
+        psutil.cpu_percent(interval=None)
+        
+        # Latest results, so widgets built later can render without waiting a tick
+        self.snapshot = None
+        self.thresholds = None
+        self.cache = {}
+        
+        # Slow collectors walk /sys on worker threads so the GUI thread never waits on
+        # them; a result is picked up by the tick after it completes
+        self.executor = ThreadPoolExecutor(max_workers=len(self.SLOW_COLLECTORS),
+                                           thread_name_prefix='stats')
+        self.pending = {}
+        
+        # Charge thresholds only change when the user applies new ones
+        self.threshold_attrs = {
+            key: SysfsAttribute(f'/sys/class/power_supply/BAT0/charge_{key}_threshold')
+            for key in ('start', 'stop')
+        }
+        QTimer.singleShot(0, self.poll_thresholds)
+        
+        # QTimer schedules against the monotonic clock, so the cadence does not
+        # drift with the time spent collecting, unlike a sleep() after each pass
+        self.tick = 0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(self.POLL_INTERVAL_MS)
+    
+    def detect_hardware(self):
+        """Detect fans and GPUs once; a tab that needs them before the deferred scan runs calls this first"""
+        if self.fan_controller is not None:
+            return
         self.fan_controller = FanController()
         self.gpu_controller = GPUController()
+        if self.timer.isActive():
+            self.poll()
     
-    def run(self):
-        while True:
-            try:
-                system_info = {
-                    'cpu_percent': psutil.cpu_percent(interval=1),
-                    'memory': psutil.virtual_memory(),
-                    'disk': psutil.disk_usage('/'),
-                    'battery': psutil.sensors_battery(),
-                    'temperatures': psutil.sensors_temperatures(),
-                    'fans': self.fan_controller.get_current_fan_speeds(),
-                    'fan_info': self.fan_controller.fan_info,
-                    'controllable_fans': self.fan_controller.controllable_fans,
-                    'gpu_info': self.gpu_controller.get_gpu_info()
-                }
-                self.data_updated.emit(system_info)
-            except Exception as e:
-                print(f"Error collecting system info: {e}")
-            self.msleep(2000)
+    def set_active(self, active):
+        """Pause polling while nothing shows its data; refresh at once on resume"""
+        if active and not self.timer.isActive():
+            if self.gpu_controller is not None:
+                self.gpu_controller.resume_sampling()
+            self.timer.start(self.POLL_INTERVAL_MS)
+            self.poll()
+        elif not active:
+            self.timer.stop()
+            if self.gpu_controller is not None:
+                self.gpu_controller.pause_sampling()
+    
+    def poll(self):
+        if self.fan_controller is None:
+            return
+        
+        self.tick += 1
+        if self.tick % self.THRESHOLD_POLL_TICKS == 0:
+            self.poll_thresholds()
+        
+        try:
+            # GPU queries are the costliest collector, so they run every Nth tick
+            if self.tick % self.GPU_POLL_TICKS == 0:
+                self.gpu_controller.get_gpu_info()
+            
+            if self.tick % self.PWM_POLL_TICKS == 0:
+                self.fan_controller.refresh_pwm_values()
+            
+            self.collect_slow_metrics()
+            
+            system_info = {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory': psutil.virtual_memory(),
+                **self.cache,
+                'fans': self.fan_controller.get_current_fan_speeds(),
+                'gpu_info': self.gpu_controller.gpu_info
+            }
+        except Exception as e:
+            print(f"Error collecting system info: {e}")
+            return
+        
+        self.snapshot = system_info
+        self.snapshot_ready.emit(system_info)
+    
+    def collect_slow_metrics(self):
+        for key, (every, collect) in self.SLOW_COLLECTORS.items():
+            future = self.pending.get(key)
+            if future is not None and future.done():
+                del self.pending[key]
+                try:
+                    self.cache[key] = future.result()
+                except Exception as e:
+                    print(f"Error collecting {key}: {e}")
+            
+            if key not in self.cache:
+                # The first snapshot needs every value, so collect it inline once
+                self.cache[key] = collect()
+            elif self.tick % every == 0 and key not in self.pending:
+                self.pending[key] = self.executor.submit(collect)
+    
+    def poll_thresholds(self):
+        thresholds = {key: attr.read() for key, attr in self.threshold_attrs.items()}
+        self.thresholds = thresholds
+        self.thresholds_ready.emit(thresholds)
+
+GIB = 1 << 30
+
+def fan_speed_band(percent):
+    """Bucket a fan speed percentage for the [band=...] style selectors"""
+    return "high" if percent > 60 else "medium" if percent > 30 else "low"
+
+def set_style_state(widget, name, value):
+    """Switch the dynamic property behind a [name="value"] selector and re-polish"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+# Temperature bands: bisect_left on the limits gives the index of the level for
+# readings strictly above each limit; APP_STYLESHEET colors each [temp=...] level
+TEMP_LIMITS = (60, 70, 80)
+TEMP_LEVELS = ("normal", "warm", "hot", "critical")
 
 class SystemInfoWidget(QWidget):
     def __init__(self):
         super().__init__()
+        self.stats_bus = SystemStatsBus.instance()
         self.init_ui()
         self.init_monitoring()
     
@@ -492,6 +1142,7 @@ class SystemInfoWidget(QWidget):
         cpu_card = self.create_metric_card("🖥️ CPU", "processor")
         self.cpu_usage = cpu_card['progress']
         self.cpu_value_label = cpu_card['value']
+        cpu_card['widget'].setToolTip(CPU_MODEL)
         overview_layout.addWidget(cpu_card['widget'], 0, 0)
         
         # Memory Card
@@ -542,23 +1193,21 @@ class SystemInfoWidget(QWidget):
         temp_layout.setContentsMargins(16, 20, 16, 16)
         temp_layout.setSpacing(10)
         
-        self.temp_text = QTextEdit()
-        self.temp_text.setMaximumHeight(120)
-        self.temp_text.setMinimumHeight(120)
-        self.temp_text.setReadOnly(True)
-        self.temp_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                color: #ffffff;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 13px;
-                padding: 12px;
-                line-height: 1.4;
-            }
-        """)
-        temp_layout.addWidget(self.temp_text)
+        # Rows are created on first sight of a sensor and then updated in place
+        self.temp_area, self.temp_grid = self.create_reading_area()
+        
+        self.temp_placeholder = QLabel("🔍 No temperature sensors detected")
+        self.temp_placeholder.setObjectName("readingName")
+        self.temp_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.temp_grid.addWidget(self.temp_placeholder, 0, 0, 1, 2)
+        
+        self.temp_labels = {}
+        self.temp_name_labels = {}
+        self.temp_values = {}
+        self.last_temp_signature = None
+        self.metric_values = {}
+        
+        temp_layout.addWidget(self.temp_area)
         
         temp_group.setLayout(temp_layout)
         info_layout.addWidget(temp_group)
@@ -569,23 +1218,25 @@ class SystemInfoWidget(QWidget):
         fan_layout.setContentsMargins(16, 20, 16, 16)
         fan_layout.setSpacing(10)
         
-        self.fan_text = QTextEdit()
-        self.fan_text.setMaximumHeight(120)
-        self.fan_text.setMinimumHeight(120)
-        self.fan_text.setReadOnly(True)
-        self.fan_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                color: #ffffff;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 13px;
-                padding: 12px;
-                line-height: 1.4;
-            }
-        """)
-        fan_layout.addWidget(self.fan_text)
+        # Fan rows are rebuilt only when the set of fans changes; readings update in place
+        self.fan_area, self.fan_grid = self.create_reading_area()
+        
+        self.fan_placeholder = QLabel(
+            "<div style='color: #cccccc;'>🔍 No fans detected or sensors not available</div>"
+            "<div style='color: #999999; font-style: italic; font-size: 12px; margin-top: 8px;'>"
+            "This is normal on some laptops where fan control is managed by proprietary firmware.</div>"
+        )
+        self.fan_placeholder.setObjectName("fanPlaceholder")
+        self.fan_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.fan_placeholder.setWordWrap(True)
+        self.fan_grid.addWidget(self.fan_placeholder, 0, 0, 1, 2)
+        
+        self.fan_row_widgets = []
+        self.fan_value_labels = {}
+        self.fan_rows_key = None
+        self.last_fan_state = None
+        
+        fan_layout.addWidget(self.fan_area)
         
         fan_group.setLayout(fan_layout)
         info_layout.addWidget(fan_group)
@@ -596,20 +1247,28 @@ class SystemInfoWidget(QWidget):
         
         self.setLayout(main_layout)
     
+    def create_reading_area(self):
+        """Create a scrollable two-column grid for sensor name/value rows"""
+        area = QScrollArea()
+        area.setWidgetResizable(True)
+        area.setMaximumHeight(120)
+        area.setMinimumHeight(120)
+        area.setObjectName("readingArea")
+        
+        container = QWidget()
+        grid = QGridLayout(container)
+        grid.setContentsMargins(12, 8, 12, 8)
+        grid.setVerticalSpacing(4)
+        grid.setColumnStretch(0, 1)
+        grid.setAlignment(Qt.AlignmentFlag.AlignTop)
+        area.setWidget(container)
+        return area, grid
+    
     def create_metric_card(self, title, metric_type):
         """Create a modern metric card widget"""
         card = QWidget()
         card.setFixedHeight(140)
-        card.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 12px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-            }
-        """)
+        card.setObjectName("metricCard")
         
         layout = QVBoxLayout()
         layout.setSpacing(8)
@@ -617,44 +1276,19 @@ class SystemInfoWidget(QWidget):
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 600;
-            color: #ffffff;
-            padding: 2px 0px;
-        """)
+        title_label.setObjectName("metricTitle")
         layout.addWidget(title_label)
         
         # Progress Bar
         progress = QProgressBar()
         progress.setMaximum(100)
         progress.setFixedHeight(24)
-        progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #404040;
-                border-radius: 6px;
-                text-align: center;
-                color: #ffffff;
-                font-weight: 600;
-                font-size: 12px;
-                background-color: #1a1a1a;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0078d4, stop: 1 #40a9ff);
-                border-radius: 4px;
-            }
-        """)
+        progress.setObjectName("metricProgress")
         layout.addWidget(progress)
         
         # Value Label
         value_label = QLabel("Loading...")
-        value_label.setStyleSheet("""
-            font-size: 12px;
-            color: #cccccc;
-            font-weight: 500;
-            padding: 2px 0px;
-        """)
+        value_label.setObjectName("metricValue")
         layout.addWidget(value_label)
         
         card.setLayout(layout)
@@ -665,111 +1299,208 @@ class SystemInfoWidget(QWidget):
             'value': value_label
         }
     
+    @property
+    def fan_controller(self):
+        return self.stats_bus.fan_controller
+    
+    @property
+    def gpu_controller(self):
+        return self.stats_bus.gpu_controller
+    
     def init_monitoring(self):
-        self.monitor_thread = SystemInfoThread()
-        self.monitor_thread.data_updated.connect(self.update_system_info)
-        self.monitor_thread.start()
-        
-        # Store reference to fan controller for other components
-        self.fan_controller = self.monitor_thread.fan_controller
+        self.stats_bus.snapshot_ready.connect(self.update_system_info)
+    
+    def set_metric(self, progress, label, percent, text):
+        """Update a metric card, skipping the widgets when the values are unchanged"""
+        if self.metric_values.get(progress) == (percent, text):
+            return
+        self.metric_values[progress] = (percent, text)
+        progress.setValue(percent)
+        label.setText(text)
     
     def update_system_info(self, data):
         # Update CPU
         cpu_percent = int(data['cpu_percent'])
-        self.cpu_usage.setValue(cpu_percent)
-        self.cpu_value_label.setText(f"{cpu_percent}% Usage")
+        self.set_metric(self.cpu_usage, self.cpu_value_label, cpu_percent, f"{cpu_percent}% Usage")
         
         # Update Memory
         memory = data['memory']
-        memory_percent = (memory.used / memory.total) * 100
-        memory_gb_used = memory.used / (1024**3)
-        memory_gb_total = memory.total / (1024**3)
-        self.memory_usage.setValue(int(memory_percent))
-        self.memory_value_label.setText(f"{memory_gb_used:.1f}GB / {memory_gb_total:.1f}GB")
+        memory_percent = memory.percent
+        memory_gb_used = memory.used / GIB
+        memory_gb_total = memory.total / GIB
+        self.set_metric(self.memory_usage, self.memory_value_label, int(memory_percent),
+                        f"{memory_gb_used:.1f}GB / {memory_gb_total:.1f}GB")
         
         # Update Disk
         disk = data['disk']
-        disk_percent = (disk.used / disk.total) * 100
-        disk_gb_used = disk.used / (1024**3)
-        disk_gb_total = disk.total / (1024**3)
-        self.disk_usage.setValue(int(disk_percent))
-        self.disk_value_label.setText(f"{disk_gb_used:.1f}GB / {disk_gb_total:.1f}GB")
+        disk_percent = disk.percent
+        disk_gb_used = disk.used / GIB
+        disk_gb_total = disk.total / GIB
+        self.set_metric(self.disk_usage, self.disk_value_label, int(disk_percent),
+                        f"{disk_gb_used:.1f}GB / {disk_gb_total:.1f}GB")
         
         # Update Battery
         battery = data['battery']
         if battery:
             battery_percent = int(battery.percent)
             status = "⚡ Charging" if battery.power_plugged else "🔋 Discharging"
-            self.battery_usage.setValue(battery_percent)
-            self.battery_value_label.setText(f"{battery_percent}% ({status})")
+            self.set_metric(self.battery_usage, self.battery_value_label, battery_percent,
+                            f"{battery_percent}% ({status})")
         else:
-            self.battery_usage.setValue(0)
-            self.battery_value_label.setText("Not Available")
+            self.set_metric(self.battery_usage, self.battery_value_label, 0, "Not Available")
 
         # Update GPU
         gpu_info = data.get('gpu_info', {})
         if gpu_info and gpu_info.get('usage') is not None and gpu_info.get('usage') != 'N/A':
             gpu_usage = int(gpu_info['usage'])
-            self.gpu_usage.setValue(gpu_usage)
-            self.gpu_value_label.setText(f"{gpu_usage}% Usage")
+            self.set_metric(self.gpu_usage, self.gpu_value_label, gpu_usage, f"{gpu_usage}% Usage")
         else:
-            self.gpu_usage.setValue(0)
-            self.gpu_value_label.setText("N/A")
+            self.set_metric(self.gpu_usage, self.gpu_value_label, 0, "N/A")
         
-        # Update Temperatures
+        # Update Temperatures, skipping the grid entirely when no reading moved
         temps = data['temperatures']
-        temp_text = ""
-        if temps:
-            temp_text += "<div style='font-size: 14px; color: #ffffff; margin-bottom: 8px;'><b>🌡️ System Temperatures</b></div>"
-            for name, entries in temps.items():
-                for entry in entries:
-                    temp = entry.current
-                    # Color code temperatures
-                    if temp > 80:
-                        color = "#ff4757"  # Red for hot
-                    elif temp > 70:
-                        color = "#ffa502"  # Orange for warm
-                    elif temp > 60:
-                        color = "#fffa65"  # Yellow for moderate
-                    else:
-                        color = "#7bed9f"  # Green for cool
-                    
-                    temp_text += f"<div style='margin: 4px 0; color: #cccccc;'>• {name}: <span style='color: {color}; font-weight: 600;'>{temp}°C</span></div>"
-        else:
-            temp_text = "<div style='color: #cccccc; text-align: center; margin-top: 20px;'>🔍 No temperature sensors detected</div>"
-        
-        self.temp_text.setHtml(temp_text)
+        temp_signature = tuple((name, entry.current) for name, entries in temps.items() for entry in entries)
+        if temp_signature != self.last_temp_signature:
+            self.last_temp_signature = temp_signature
+            self.update_temperature_labels(temps)
         
         # Update Fan Information
         fans = data.get('fans', {})
-        fan_info = data.get('fan_info', {})
-        controllable_fans = data.get('controllable_fans', {})
-        
-        fan_text = ""
-        if fans:
-            fan_text += "<div style='font-size: 14px; color: #ffffff; margin-bottom: 8px;'><b>🌀 Detected Fans</b></div>"
-            for fan_key, rpm in fans.items():
-                fan_name = fan_info.get(fan_key, {}).get('name', fan_key)
-                fan_text += f"<div style='margin: 4px 0; color: #cccccc;'>• {fan_name}: <span style='color: #0078d4; font-weight: 600;'>{rpm} RPM</span></div>"
-            
-            if controllable_fans:
-                fan_text += "<div style='font-size: 14px; color: #ffffff; margin: 12px 0 8px 0;'><b>⚙️ Controllable Fans</b></div>"
-                for fan_key, info in controllable_fans.items():
-                    fan_name = info.get('name', fan_key)
-                    current_pwm = info.get('current_pwm', 0)
-                    pwm_percent = round((current_pwm / 255) * 100)
-                    color = "#7bed9f" if pwm_percent > 60 else "#ffa502" if pwm_percent > 30 else "#ff4757"
-                    fan_text += f"<div style='margin: 4px 0; color: #cccccc;'>• {fan_name}: <span style='color: {color}; font-weight: 600;'>{pwm_percent}% PWM</span></div>"
-        else:
-            fan_text = "<div style='color: #cccccc; text-align: center; margin-top: 15px;'>🔍 No fans detected or sensors not available</div>"
-            fan_text += "<div style='color: #999999; font-style: italic; text-align: center; margin-top: 8px; font-size: 12px;'>This is normal on some laptops where fan control is managed by proprietary firmware.</div>"
+        # Fan names and PWM controls only change on re-detection, so read them
+        # from the controller rather than shipping them in every snapshot
+        fan_info = self.fan_controller.fan_info
+        controllable_fans = self.fan_controller.controllable_fans
+        
+        # Nothing to touch when no reading moved
+        fan_state = (tuple(fans.items()),
+                     tuple((key, info.get('current_pwm')) for key, info in controllable_fans.items()))
+        if fan_state == self.last_fan_state:
+            return
+        self.last_fan_state = fan_state
+        
+        self.update_fan_labels(fans, fan_info, controllable_fans)
+
+    def update_fan_labels(self, fans, fan_info, controllable_fans):
+        """Update fan readings in place, rebuilding rows only when fans come or go"""
+        pwm_keys = tuple(controllable_fans) if fans else ()
+        rows_key = (tuple(fans), pwm_keys)
+        if rows_key != self.fan_rows_key:
+            self.fan_rows_key = rows_key
+            self.rebuild_fan_rows(fans, fan_info, controllable_fans, pwm_keys)
+        
+        for fan_key, rpm in fans.items():
+            self.set_fan_value(('rpm', fan_key), f"{rpm} RPM")
+        
+        for fan_key in pwm_keys:
+            current_pwm = controllable_fans[fan_key].get('current_pwm', 0)
+            pwm_percent = _PWM_PCT[min(current_pwm, 255)]
+            self.set_fan_value(('pwm', fan_key), f"{pwm_percent}% PWM", fan_speed_band(pwm_percent))
+    
+    def rebuild_fan_rows(self, fans, fan_info, controllable_fans, pwm_keys):
+        for widget in self.fan_row_widgets:
+            self.fan_grid.removeWidget(widget)
+            widget.deleteLater()
+        self.fan_row_widgets = []
+        self.fan_value_labels = {}
+        self.fan_placeholder.setVisible(not fans)
+        if not fans:
+            return
         
-        self.fan_text.setHtml(fan_text)
+        sections = [("🌀 Detected Fans", 'rpm',
+                     [(key, fan_info.get(key, {}).get('name', key)) for key in fans])]
+        if pwm_keys:
+            sections.append(("⚙️ Controllable Fans", 'pwm',
+                             [(key, controllable_fans[key].get('name', key)) for key in pwm_keys]))
+        
+        row = 1
+        for title, kind, entries in sections:
+            header = QLabel(title)
+            header.setObjectName("readingHeader")
+            self.fan_grid.addWidget(header, row, 0, 1, 2)
+            self.fan_row_widgets.append(header)
+            row += 1
+            for fan_key, fan_name in entries:
+                name_label = QLabel(f"• {fan_name}")
+                name_label.setObjectName("readingName")
+                value_label = QLabel()
+                value_label.setObjectName("readingValue")
+                self.fan_grid.addWidget(name_label, row, 0)
+                self.fan_grid.addWidget(value_label, row, 1)
+                self.fan_row_widgets += [name_label, value_label]
+                self.fan_value_labels[(kind, fan_key)] = value_label
+                row += 1
+    
+    def set_fan_value(self, key, text, band=None):
+        label = self.fan_value_labels[key]
+        if label.text() != text:
+            label.setText(text)
+        if band is not None:
+            set_style_state(label, 'band', band)
+
+    def update_temperature_labels(self, temps):
+        """Update the temperature grid in place, adding rows for new sensors and dropping vanished ones"""
+        self.temp_placeholder.setVisible(not temps)
+        
+        current_keys = {(name, i) for name, entries in temps.items() for i in range(len(entries))}
+        stale_keys = self.temp_labels.keys() - current_keys
+        if stale_keys:
+            self.remove_temperature_rows(stale_keys)
+        
+        for name, entries in temps.items():
+            for i, entry in enumerate(entries):
+                key = (name, i)
+                temp = entry.current
+                if self.temp_values.get(key) == temp:
+                    continue
+                
+                label = self.temp_labels.get(key)
+                if label is None:
+                    row = len(self.temp_labels) + 1
+                    name_label = QLabel(f"• {name}")
+                    name_label.setObjectName("readingName")
+                    label = QLabel()
+                    label.setObjectName("readingValue")
+                    self.temp_grid.addWidget(name_label, row, 0)
+                    self.temp_grid.addWidget(label, row, 1)
+                    self.temp_labels[key] = label
+                    self.temp_name_labels[key] = name_label
+                
+                # Color code temperatures
+                level = TEMP_LEVELS[bisect.bisect_left(TEMP_LIMITS, temp)]
+                
+                self.temp_values[key] = temp
+                label.setText(f"{temp}°C")
+                set_style_state(label, 'temp', level)
+
+    def remove_temperature_rows(self, keys):
+        """Delete the rows of sensors that went away (dGPU powered down, driver unloaded)"""
+        for key in keys:
+            for widget in (self.temp_name_labels.pop(key), self.temp_labels.pop(key)):
+                self.temp_grid.removeWidget(widget)
+                widget.deleteLater()
+            self.temp_values.pop(key, None)
+        
+        # Close the gaps so the next new sensor lands on the first free row
+        for row, key in enumerate(self.temp_labels, start=1):
+            for column, widget in enumerate((self.temp_name_labels[key], self.temp_labels[key])):
+                self.temp_grid.removeWidget(widget)
+                self.temp_grid.addWidget(widget, row, column)
 
 class BatteryControlWidget(QWidget):
     def __init__(self):
         super().__init__()
+        self.battery = None
+        self.thresholds = None
+        self.last_info_text = None
         self.init_ui()
+        
+        self.stats_bus = SystemStatsBus.instance()
+        self.stats_bus.snapshot_ready.connect(self.on_snapshot)
+        self.stats_bus.thresholds_ready.connect(self.on_thresholds)
+        if self.stats_bus.snapshot is not None:
+            self.on_snapshot(self.stats_bus.snapshot)
+        if self.stats_bus.thresholds is not None:
+            self.on_thresholds(self.stats_bus.thresholds)
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -808,7 +1539,7 @@ class BatteryControlWidget(QWidget):
         
         self.battery_info = QTextEdit()
         self.battery_info.setMaximumHeight(150)
-        self.update_battery_info()
+        self.battery_info.setText("Loading...")
         
         info_layout.addWidget(self.battery_info)
         info_group.setLayout(info_layout)
@@ -817,68 +1548,116 @@ class BatteryControlWidget(QWidget):
         self.setLayout(layout)
     
     def apply_battery_thresholds(self):
-        try:
-            start_val = self.start_threshold.value()
-            stop_val = self.stop_threshold.value()
-            
-            if start_val >= stop_val:
-                QMessageBox.warning(self, "Invalid Range", 
-                                  "Start threshold must be less than stop threshold!")
-                return
-            
-            # Apply thresholds (requires root access)
-            start_cmd = f"echo {start_val} | pkexec tee /sys/class/power_supply/BAT0/charge_start_threshold"
-            stop_cmd = f"echo {stop_val} | pkexec tee /sys/class/power_supply/BAT0/charge_stop_threshold"
-            
-            subprocess.run(start_cmd, shell=True, check=True)
-            subprocess.run(stop_cmd, shell=True, check=True)
-            
+        start_val = self.start_threshold.value()
+        stop_val = self.stop_threshold.value()
+        
+        if start_val >= stop_val:
+            QMessageBox.warning(self, "Invalid Range", 
+                              "Start threshold must be less than stop threshold!")
+            return
+        
+        # Apply both thresholds under one authorization (requires root access),
+        # off the GUI thread so the polkit prompt does not freeze the window
+        writes = [
+            ('/sys/class/power_supply/BAT0/charge_start_threshold', start_val),
+            ('/sys/class/power_supply/BAT0/charge_stop_threshold', stop_val),
+        ]
+        run_in_background(lambda: pkexec_write_batch(writes),
+                          lambda _, error: self.on_thresholds_applied(start_val, stop_val, error))
+    
+    def on_thresholds_applied(self, start_val, stop_val, error):
+        if error is None:
+            self.stats_bus.poll_thresholds()
             QMessageBox.information(self, "Success", 
                                   f"Battery thresholds set: {start_val}% - {stop_val}%")
-            
-        except subprocess.CalledProcessError:
+        elif isinstance(error, subprocess.CalledProcessError):
             QMessageBox.critical(self, "Error", 
                                "Failed to apply battery thresholds. Make sure you have proper permissions.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+        else:
+            QMessageBox.critical(self, "Error", f"Unexpected error: {str(error)}")
+    
+    def on_snapshot(self, data):
+        self.battery = data['battery']
+        self.update_battery_info()
+    
+    def on_thresholds(self, thresholds):
+        self.thresholds = thresholds
+        self.update_battery_info()
     
     def update_battery_info(self):
         try:
-            # Get battery information
-            battery = psutil.sensors_battery()
-            info_text = ""
+            battery = self.battery
+            parts = []
             
             if battery:
-                info_text += f"Battery Percentage: {battery.percent}%\n"
-                info_text += f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n"
+                parts.append(f"Battery Percentage: {battery.percent}%\n")
+                parts.append(f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n")
                 if battery.secsleft != psutil.POWER_TIME_UNLIMITED:
                     hours, remainder = divmod(battery.secsleft, 3600)
                     minutes, _ = divmod(remainder, 60)
-                    info_text += f"Time Remaining: {hours:02d}:{minutes:02d}\n"
-            
-            # Try to get current thresholds
-            try:
-                with open('/sys/class/power_supply/BAT0/charge_start_threshold', 'r') as f:
-                    start = f.read().strip()
-                    info_text += f"Current Start Threshold: {start}%\n"
-            except:
-                info_text += "Current Start Threshold: N/A\n"
+                    parts.append(f"Time Remaining: {hours:02d}:{minutes:02d}\n")
             
-            try:
-                with open('/sys/class/power_supply/BAT0/charge_stop_threshold', 'r') as f:
-                    stop = f.read().strip()
-                    info_text += f"Current Stop Threshold: {stop}%\n"
-            except:
-                info_text += "Current Stop Threshold: N/A\n"
+            # Current thresholds, refreshed on a slower cadence by the stats bus
+            thresholds = self.thresholds or {}
+            start = thresholds.get('start')
+            stop = thresholds.get('stop')
+            parts.append(f"Current Start Threshold: {start}%\n" if start else "Current Start Threshold: N/A\n")
+            parts.append(f"Current Stop Threshold: {stop}%\n" if stop else "Current Stop Threshold: N/A\n")
+            info_text = "".join(parts)
             
-            self.battery_info.setText(info_text)
+            if info_text != self.last_info_text:
+                self.last_info_text = info_text
+                self.battery_info.setText(info_text)
             
         except Exception as e:
             self.battery_info.setText(f"Error reading battery info: {str(e)}")
 
+# Fan speed preview colors: before the first slider move, then per fan_speed_band()
+FAN_SPEED_COLORS = {None: "#0078d4", "high": "#7bed9f", "medium": "#fffa65", "low": "#ff4757"}
+
+# Safety warning per slider range: (upper limit, [level=...] for the style sheet, text)
+FAN_SAFETY_LEVELS = (
+    (20, "low", "⚠️ Low speed - Monitor temperatures closely!"),
+    (40, "moderate", "⚠️ Moderate speed - Watch temperatures"),
+    (101, "safe", "✅ Safe operating range"),
+)
+
 class PowerControlWidget(QWidget):
-    def __init__(self):
+    FAN_POLL_INTERVAL_MS = 3000
+    # Fans rarely come and go, so the full re-detection only runs every Nth poll
+    FAN_DETECT_TICKS = 10
+    
+    def __init__(self, fan_controller=None):
         super().__init__()
+        self._backlight_fd = None
+        self.fan_controller = fan_controller
+        self.fan_interval_multiplier = 1
+        self.fan_poll_count = 0
+        # One palette per preview color; swapping palettes avoids re-polishing on every slider step
+        self.fan_speed_palettes = {}
+        for band, color in FAN_SPEED_COLORS.items():
+            palette = QPalette(self.palette())
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+            self.fan_speed_palettes[band] = palette
+        # The backlight device and its range are fixed, so probe them once
+        self.backlight_path, self.backlight_max = self.detect_backlight()
+        self.xrandr = self.detect_xrandr() if self.backlight_path is None else None
+        # One brightness write in flight at a time; the newest value waits behind it
+        self._brightness_busy = False
+        self._queued_brightness = None
+        self._last_brightness = None
+        # Output name that accepted the last xrandr command, and Qt's name for the
+        # primary output; both are refreshed on the GUI thread when screens change
+        self._xrandr_output = None
+        self._primary_output = ""
+        app = QApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self.forget_xrandr_output)
+            app.screenRemoved.connect(self.forget_xrandr_output)
+            app.primaryScreenChanged.connect(self.forget_xrandr_output)
+            self.forget_xrandr_output()
+        self.governor_attr = SysfsAttribute('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor')
+        self.governor_paths = self.detect_governor_paths()
         self.init_ui()
     
     def init_ui(self):
@@ -892,17 +1671,7 @@ class PowerControlWidget(QWidget):
         
         # CPU Governor Control Card
         governor_card = QWidget()
-        governor_card.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 16px;
-                padding: 20px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-            }
-        """)
+        governor_card.setObjectName("card")
         
         governor_layout = QVBoxLayout()
         governor_layout.setSpacing(16)
@@ -911,16 +1680,11 @@ class PowerControlWidget(QWidget):
         # CPU Governor Header
         cpu_header = QHBoxLayout()
         cpu_icon = QLabel("⚡")
-        cpu_icon.setStyleSheet("font-size: 24px;")
+        cpu_icon.setObjectName("cardIcon")
         cpu_header.addWidget(cpu_icon)
         
         cpu_title = QLabel("CPU Governor")
-        cpu_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #ffffff;
-            margin-left: 8px;
-        """)
+        cpu_title.setObjectName("cardTitle")
         cpu_header.addWidget(cpu_title)
         cpu_header.addStretch()
         governor_layout.addLayout(cpu_header)
@@ -929,10 +1693,7 @@ class PowerControlWidget(QWidget):
         current_layout = QHBoxLayout()
         current_layout.addWidget(QLabel("Current:"))
         self.current_governor = QLabel("Loading...")
-        self.current_governor.setStyleSheet("""
-            font-weight: 600;
-            color: #0078d4;
-        """)
+        self.current_governor.setObjectName("accentValue")
         current_layout.addWidget(self.current_governor)
         current_layout.addStretch()
         governor_layout.addLayout(current_layout)
@@ -942,11 +1703,10 @@ class PowerControlWidget(QWidget):
         selection_layout.setSpacing(8)
         
         set_label = QLabel("Set Governor:")
-        set_label.setStyleSheet("font-weight: 500; color: #cccccc;")
+        set_label.setObjectName("fieldLabel")
         selection_layout.addWidget(set_label)
         
         self.governor_combo = QComboBox()
-        self.load_available_governors()
         selection_layout.addWidget(self.governor_combo)
         
         apply_governor_btn = QPushButton("🚀 Apply Governor")
@@ -959,17 +1719,7 @@ class PowerControlWidget(QWidget):
         
         # Brightness Control Card
         brightness_card = QWidget()
-        brightness_card.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 16px;
-                padding: 20px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-            }
-        """)
+        brightness_card.setObjectName("card")
         
         brightness_layout = QVBoxLayout()
         brightness_layout.setSpacing(16)
@@ -978,16 +1728,11 @@ class PowerControlWidget(QWidget):
         # Brightness Header
         brightness_header = QHBoxLayout()
         brightness_icon = QLabel("🔆")
-        brightness_icon.setStyleSheet("font-size: 24px;")
+        brightness_icon.setObjectName("cardIcon")
         brightness_header.addWidget(brightness_icon)
         
         brightness_title = QLabel("Display Brightness")
-        brightness_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #ffffff;
-            margin-left: 8px;
-        """)
+        brightness_title.setObjectName("cardTitle")
         brightness_header.addWidget(brightness_title)
         brightness_header.addStretch()
         brightness_layout.addLayout(brightness_header)
@@ -997,7 +1742,7 @@ class PowerControlWidget(QWidget):
         slider_layout.setSpacing(8)
         
         brightness_label = QLabel("Brightness Level:")
-        brightness_label.setStyleSheet("font-weight: 500; color: #cccccc;")
+        brightness_label.setObjectName("fieldLabel")
         slider_layout.addWidget(brightness_label)
         
         slider_container = QHBoxLayout()
@@ -1006,17 +1751,20 @@ class PowerControlWidget(QWidget):
         self.brightness_slider.setMinimum(1)
         self.brightness_slider.setMaximum(100)
         self.brightness_slider.setValue(50)
-        self.brightness_slider.valueChanged.connect(self.change_brightness)
+        # While dragging only the label previews the value; the write happens on release
+        self.brightness_slider.valueChanged.connect(self.queue_brightness_change)
         self.brightness_slider.valueChanged.connect(self.update_brightness_label)
+        self.brightness_slider.sliderReleased.connect(self.apply_pending_brightness)
+        
+        # Coalesce slider steps into a single write once the user pauses
+        self._brightness_timer = QTimer(self)
+        self._brightness_timer.setSingleShot(True)
+        self._brightness_timer.setInterval(150)
+        self._brightness_timer.timeout.connect(self.apply_pending_brightness)
         slider_container.addWidget(self.brightness_slider)
         
         self.brightness_value_label = QLabel("50%")
-        self.brightness_value_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 600;
-            color: #0078d4;
-            min-width: 40px;
-        """)
+        self.brightness_value_label.setObjectName("sliderValue")
         slider_container.addWidget(self.brightness_value_label)
         
         slider_layout.addLayout(slider_container)
@@ -1037,6 +1785,20 @@ class PowerControlWidget(QWidget):
         # Initially hidden, will be shown if controllable fans are detected
         self.fan_control_group.setVisible(False)
         self.fan_controllers = {}
+        # Percentage each fan card last showed, so unchanged readings skip the widgets
+        self.last_pwm_percent = {}
+        
+        # PWM nodes whose driver calls sysfs_notify() report changes through POLLPRI;
+        # once a node has done so the timer stops re-reading it
+        self.pwm_notifiers = {}
+        self.pwm_event_keys = set()
+        
+        # Queued fan speed writes, flushed together once Apply presses settle
+        self.pending_fan_speeds = {}
+        self._fan_write_timer = QTimer(self)
+        self._fan_write_timer.setSingleShot(True)
+        self._fan_write_timer.setInterval(150)
+        self._fan_write_timer.timeout.connect(self.flush_fan_speeds)
         
         main_layout.addWidget(self.fan_control_group)
         
@@ -1044,111 +1806,197 @@ class PowerControlWidget(QWidget):
         main_layout.addStretch()
         
         self.setLayout(main_layout)
+        
+        # Populate from sysfs once the event loop is running so the tab paints first
+        QTimer.singleShot(0, self.deferred_init)
+    
+    def deferred_init(self):
+        self.load_available_governors()
         self.update_current_governor()
+        self.load_current_brightness()
         
-        # Set up fan monitoring
+        # Set up fan monitoring; the first showEvent may have come before the timer existed
         self.setup_fan_monitoring()
+        self.set_polling(self.isVisible())
+    
+    def load_current_brightness(self):
+        """Start the slider at the backlight's actual level, read straight from sysfs"""
+        if not self.backlight_path or not self.backlight_max:
+            return
+        current = SysfsAttribute(self.backlight_path).read_int()
+        if current is None:
+            return
+        value = max(1, min(100, round(current * 100 / self.backlight_max)))
+        # Showing the current level is not a change to apply
+        self.brightness_slider.blockSignals(True)
+        self.brightness_slider.setValue(value)
+        self.brightness_slider.blockSignals(False)
+        self.update_brightness_label(value)
+        self._last_brightness = value
     
     def update_brightness_label(self, value):
         """Update brightness value label"""
         self.brightness_value_label.setText(f"{value}%")
     
+    def queue_brightness_change(self, value):
+        """Debounce keyboard/wheel changes; drags are committed by sliderReleased"""
+        if self.brightness_slider.isSliderDown():
+            return
+        self._brightness_timer.start()
+    
+    def apply_pending_brightness(self):
+        self._brightness_timer.stop()
+        self.change_brightness(self.brightness_slider.value())
+    
+    def write_backlight_direct(self, path, value):
+        """Write the backlight through a held fd when the node is user-writable"""
+        if self._backlight_fd is None:
+            if not os.access(path, os.W_OK):
+                return False
+            self._backlight_fd = os.open(path, os.O_WRONLY)
+        os.pwrite(self._backlight_fd, str(value).encode(), 0)
+        return True
+    
     def load_available_governors(self):
         try:
-            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors', 'r') as f:
-                governors = f.read().strip().split()
-                self.governor_combo.addItems(governors)
-        except:
+            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors', 'rb') as f:
+                self.governor_combo.addItems([name.decode() for name in f.read().split()])
+        except OSError:
             self.governor_combo.addItems(['performance', 'powersave', 'ondemand', 'conservative'])
     
     def update_current_governor(self):
-        try:
-            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor', 'r') as f:
-                current = f.read().strip()
-                self.current_governor.setText(current)
-        except:
-            self.current_governor.setText("N/A")
+        current = self.governor_attr.read()
+        self.current_governor.setText(current or "N/A")
+    
+    def detect_governor_paths(self):
+        """One scaling_governor per cpufreq policy; CPUs sharing a policy follow it"""
+        policy_paths = sorted(glob.glob('/sys/devices/system/cpu/cpufreq/policy[0-9]*/scaling_governor'))
+        if policy_paths:
+            return policy_paths
+        return sorted(glob.glob('/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor'))
     
     def apply_cpu_governor(self):
-        try:
-            governor = self.governor_combo.currentText()
-            cmd = f"echo {governor} | pkexec tee /sys/devices/system/cpu/cpu*/cpufreq/scaling_governor"
-            subprocess.run(cmd, shell=True, check=True)
+        governor = self.governor_combo.currentText()
+        governor_paths = self.governor_paths
+        # The polkit prompt can take seconds; keep the window responsive meanwhile
+        run_in_background(lambda: pkexec_write(governor_paths, governor),
+                          lambda _, error: self.on_governor_applied(governor, error))
+    
+    def on_governor_applied(self, governor, error):
+        if error is None:
             self.update_current_governor()
             QMessageBox.information(self, "Success", f"CPU governor set to: {governor}")
-        except subprocess.CalledProcessError:
+        elif isinstance(error, subprocess.CalledProcessError):
             QMessageBox.critical(self, "Error", "Failed to set CPU governor. Check permissions.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
+        else:
+            QMessageBox.critical(self, "Error", f"Unexpected error: {str(error)}")
     
     def setup_fan_monitoring(self):
-        """Set up fan monitoring and control interface"""
-        try:
-            # Create a timer to periodically check for fan updates
-            self.fan_timer = QTimer()
-            self.fan_timer.timeout.connect(self.update_fan_controls)
-            self.fan_timer.start(3000)  # Update every 3 seconds
-            
-            # Initial fan control setup
+        """Set up the fan poll timer; it runs, and the fan cards get built, only while shown"""
+        self.fan_timer = QTimer(self)
+        self.fan_timer.timeout.connect(self.update_fan_controls)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.set_polling(True)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.set_polling(False)
+    
+    def set_polling(self, active):
+        """Start or park the fan timer depending on whether this tab is shown"""
+        if not hasattr(self, 'fan_timer'):
+            return
+        if active and not self.fan_timer.isActive():
+            self.fan_timer.start(self.FAN_POLL_INTERVAL_MS * self.fan_interval_multiplier)
+            self.update_fan_controls()
+        elif not active:
+            self.fan_timer.stop()
+    
+    def set_interval_multiplier(self, multiplier):
+        """Stretch the fan poll interval while the window is in the background or on battery"""
+        if multiplier == self.fan_interval_multiplier:
+            return
+        speeding_up = multiplier < self.fan_interval_multiplier
+        self.fan_interval_multiplier = multiplier
+        if not hasattr(self, 'fan_timer'):
+            return
+        self.fan_timer.setInterval(self.FAN_POLL_INTERVAL_MS * multiplier)
+        if speeding_up and self.fan_timer.isActive():
+            # Refresh readings that went stale while throttled
             self.update_fan_controls()
-        except Exception as e:
-            print(f"Error setting up fan monitoring: {e}")
     
     def update_fan_controls(self):
         """Update fan control interface based on detected fans"""
+        # Tabs built before hardware detection finished get the controller late
+        if self.fan_controller is None:
+            self.fan_controller = SystemStatsBus.instance().fan_controller
+            if self.fan_controller is None:
+                return
+        fan_controller = self.fan_controller
         try:
-            # Get the main window to access the system info widget
-            main_window = self.parent().parent()
-            if hasattr(main_window, 'tab_widget'):
-                system_info_widget = main_window.tab_widget.widget(0)
-                if hasattr(system_info_widget, 'fan_controller'):
-                    fan_controller = system_info_widget.fan_controller
-                    
-                    # Re-detect fans periodically
-                    fan_controller.detect_fans()
-                    fan_controller.detect_controllable_fans()
-                    
-                    # Update controllable fans
-                    controllable_fans = fan_controller.controllable_fans
-                    
-                    if controllable_fans and not self.fan_control_group.isVisible():
-                        self.create_fan_control_interface(controllable_fans, fan_controller)
-                        self.fan_control_group.setVisible(True)
-                    elif controllable_fans:
-                        self.update_fan_status(controllable_fans)
-                    elif not controllable_fans and self.fan_control_group.isVisible():
-                        # Hide fan controls if no controllable fans are detected
-                        self.fan_control_group.setVisible(False)
+            # Re-detect fans periodically; in between only the PWM values move
+            self.fan_poll_count += 1
+            if self.fan_poll_count % self.FAN_DETECT_TICKS == 0:
+                fan_controller.detect_fans()
+                fan_controller.detect_controllable_fans()
+                self.watch_pwm_nodes(fan_controller)
+            elif self.pwm_notifiers and self.pwm_event_keys >= fan_controller.controllable_fans.keys():
+                # Every control reports its own changes; nothing to poll until re-detection
+                return
+            else:
+                fan_controller.refresh_pwm_values(skip=self.pwm_event_keys)
+            
+            # Update controllable fans
+            controllable_fans = fan_controller.controllable_fans
+            
+            if controllable_fans:
+                if not hasattr(self, 'fan_mode_combo'):
+                    self.create_fan_control_interface()
+                    self.watch_pwm_nodes(fan_controller)
+                self.sync_fan_controls(controllable_fans, fan_controller)
+                self.fan_control_group.setVisible(True)
+            elif self.fan_control_group.isVisible():
+                # Hide fan controls if no controllable fans are detected
+                self.fan_control_group.setVisible(False)
         except Exception as e:
             print(f"Error updating fan controls: {e}")
             # Optionally show error in UI
             if hasattr(self, 'fan_control_group'):
                 self.fan_control_group.setToolTip(f"Fan control error: {str(e)}")
     
-    def create_fan_control_interface(self, controllable_fans, fan_controller):
-        """Create the fan control interface"""
-        # Clear existing layout
-        for i in reversed(range(self.fan_control_layout.count())):
-            child = self.fan_control_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        self.fan_controllers = {}
-        
+    def watch_pwm_nodes(self, fan_controller):
+        """Arm a POLLPRI notifier on each PWM node that does not have one yet"""
+        for fan_key, attr in fan_controller.pwm_attrs.items():
+            if fan_key in self.pwm_notifiers or attr.fd is None:
+                continue
+            notifier = QSocketNotifier(attr.fd, QSocketNotifier.Type.Exception, self)
+            notifier.activated.connect(lambda *_, key=fan_key: self.on_pwm_notified(key))
+            self.pwm_notifiers[fan_key] = notifier
+    
+    def on_pwm_notified(self, fan_key):
+        """The kernel flagged a PWM change: read it and update that fan's card"""
+        if not self.fan_controller.refresh_pwm_value(fan_key):
+            # Only a successful read re-arms POLLPRI; a vanished node would fire forever
+            self.unwatch_pwm_node(fan_key)
+            return
+        self.pwm_event_keys.add(fan_key)
+        self.update_fan_status({fan_key: self.fan_controller.controllable_fans[fan_key]})
+    
+    def unwatch_pwm_node(self, fan_key):
+        """Drop a PWM node's notifier so the fan timer polls it again"""
+        notifier = self.pwm_notifiers.pop(fan_key, None)
+        if notifier is not None:
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        self.pwm_event_keys.discard(fan_key)
+    
+    def create_fan_control_interface(self):
+        """Create the fan mode card; per-fan cards are added by sync_fan_controls"""
         # Add enhanced fan mode control
         mode_card = QWidget()
-        mode_card.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 16px;
-                padding: 20px;
-                margin: 8px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-            }
-        """)
+        mode_card.setObjectName("fanModeCard")
         
         mode_layout = QVBoxLayout()
         mode_layout.setSpacing(16)
@@ -1158,16 +2006,11 @@ class PowerControlWidget(QWidget):
         header_layout = QHBoxLayout()
         
         mode_icon = QLabel("⚙️")
-        mode_icon.setStyleSheet("font-size: 24px;")
+        mode_icon.setObjectName("cardIcon")
         header_layout.addWidget(mode_icon)
         
         mode_title = QLabel("Fan Control Mode")
-        mode_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #ffffff;
-            margin-left: 8px;
-        """)
+        mode_title.setObjectName("cardTitle")
         header_layout.addWidget(mode_title)
         header_layout.addStretch()
         
@@ -1178,64 +2021,19 @@ class PowerControlWidget(QWidget):
         selection_layout.setSpacing(16)
         
         mode_label = QLabel("Control Mode:")
-        mode_label.setStyleSheet("""
-            font-size: 14px;
-            color: #cccccc;
-            font-weight: 500;
-        """)
+        mode_label.setObjectName("fieldLabel")
         selection_layout.addWidget(mode_label)
         
         self.fan_mode_combo = QComboBox()
         self.fan_mode_combo.addItems(["🤖 Automatic", "👤 Manual"])
-        self.fan_mode_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #1a1a1a;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 150px;
-            }
-            QComboBox:hover {
-                border-color: #0078d4;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-        """)
+        self.fan_mode_combo.setObjectName("fanModeCombo")
         self.fan_mode_combo.currentTextChanged.connect(self.on_fan_mode_changed)
         selection_layout.addWidget(self.fan_mode_combo)
         
         selection_layout.addStretch()
         
         apply_mode_btn = QPushButton("🚀 Apply Mode")
-        apply_mode_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
+        apply_mode_btn.setObjectName("fanModeButton")
         apply_mode_btn.clicked.connect(self.apply_fan_mode)
         selection_layout.addWidget(apply_mode_btn)
         
@@ -1243,45 +2041,36 @@ class PowerControlWidget(QWidget):
         
         # Mode description
         self.mode_description = QLabel("🤖 Automatic mode: System controls fan speeds based on temperature")
-        self.mode_description.setStyleSheet("""
-            font-size: 12px;
-            color: #7bed9f;
-            font-weight: 500;
-            margin-top: 8px;
-            padding: 8px 12px;
-            background-color: #1a1a1a;
-            border-radius: 6px;
-        """)
+        self.mode_description.setObjectName("fanModeDescription")
+        set_style_state(self.mode_description, 'mode', 'automatic')
         mode_layout.addWidget(self.mode_description)
         
         mode_card.setLayout(mode_layout)
         self.fan_control_layout.addWidget(mode_card)
-        
-        # Add individual fan controls
+    
+    def sync_fan_controls(self, controllable_fans, fan_controller):
+        """Add cards for new fans, drop vanished ones and refresh the rest"""
+        for fan_key in self.fan_controllers.keys() - controllable_fans.keys():
+            fan_card = self.fan_controllers.pop(fan_key)['group']
+            self.last_pwm_percent.pop(fan_key, None)
+            self.fan_control_layout.removeWidget(fan_card)
+            fan_card.deleteLater()
+        
+        is_manual = "Manual" in self.fan_mode_combo.currentText()
         for fan_key, fan_info in controllable_fans.items():
-            fan_widget = self.create_fan_control_widget(fan_key, fan_info, fan_controller)
-            self.fan_control_layout.addWidget(fan_widget)
-            
-        # Store reference to fan controller
-        self.fan_controller = fan_controller
+            if fan_key not in self.fan_controllers:
+                fan_widget = self.create_fan_control_widget(fan_key, fan_info, fan_controller)
+                self.fan_control_layout.addWidget(fan_widget)
+                self.fan_controllers[fan_key]['speed_slider'].setEnabled(is_manual)
+                self.fan_controllers[fan_key]['apply_btn'].setEnabled(is_manual)
+        
+        self.update_fan_status(controllable_fans)
     
     def create_fan_control_widget(self, fan_key, fan_info, fan_controller):
         """Create a modern control widget for a single fan"""
         # Create main fan card
         fan_card = QWidget()
-        fan_card.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 16px;
-                padding: 20px;
-                margin: 8px;
-            }
-            QWidget:hover {
-                border-color: #0078d4;
-                background-color: #323232;
-            }
-        """)
+        fan_card.setObjectName("fanCard")
         
         main_layout = QVBoxLayout()
         main_layout.setSpacing(16)
@@ -1292,30 +2081,22 @@ class PowerControlWidget(QWidget):
         
         # Fan icon and name
         fan_icon = QLabel("🌀")
-        fan_icon.setStyleSheet("font-size: 24px;")
+        fan_icon.setObjectName("cardIcon")
         header_layout.addWidget(fan_icon)
         
         fan_name_label = QLabel(fan_info['name'])
-        fan_name_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #ffffff;
-            margin-left: 8px;
-        """)
+        fan_name_label.setObjectName("cardTitle")
         header_layout.addWidget(fan_name_label)
         
         header_layout.addStretch()
         
         # Status indicator
         current_pwm = fan_info.get('current_pwm', 0)
-        pwm_percent = round((current_pwm / 255) * 100)
-        
-        status_color = "#00ff00" if pwm_percent > 60 else "#ffff00" if pwm_percent > 30 else "#ff6b6b"
-        status_label = QLabel(f"●")
-        status_label.setStyleSheet(f"""
-            font-size: 20px;
-            color: {status_color};
-        """)
+        pwm_percent = _PWM_PCT[min(current_pwm, 255)]
+        
+        status_label = QLabel("●")
+        status_label.setObjectName("fanStatus")
+        set_style_state(status_label, 'band', fan_speed_band(pwm_percent))
         header_layout.addWidget(status_label)
         
         main_layout.addLayout(header_layout)
@@ -1324,47 +2105,28 @@ class PowerControlWidget(QWidget):
         speed_info_layout = QHBoxLayout()
         
         current_label = QLabel("Current Speed:")
-        current_label.setStyleSheet("""
-            font-size: 14px;
-            color: #cccccc;
-            font-weight: 500;
-        """)
+        current_label.setObjectName("fieldLabel")
         speed_info_layout.addWidget(current_label)
         
         speed_info_layout.addStretch()
         
         pwm_label = QLabel(f"{pwm_percent}%")
-        pwm_label.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {status_color};
-        """)
+        pwm_label.setObjectName("fanPwm")
+        set_style_state(pwm_label, 'band', fan_speed_band(pwm_percent))
         speed_info_layout.addWidget(pwm_label)
         
         main_layout.addLayout(speed_info_layout)
         
         # Speed control section
         control_group = QWidget()
-        control_group.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border: 1px solid #404040;
-                border-radius: 12px;
-                padding: 16px;
-            }
-        """)
+        control_group.setObjectName("fanControlGroup")
         
         control_layout = QVBoxLayout()
         control_layout.setSpacing(12)
         
         # Set speed label
         set_speed_label = QLabel("Set Speed:")
-        set_speed_label.setStyleSheet("""
-            font-size: 14px;
-            color: #ffffff;
-            font-weight: 600;
-            margin-bottom: 8px;
-        """)
+        set_speed_label.setObjectName("sectionLabel")
         control_layout.addWidget(set_speed_label)
         
         # Slider container
@@ -1379,80 +2141,26 @@ class PowerControlWidget(QWidget):
         speed_slider.setEnabled(False)  # Disabled in automatic mode by default
         
         # Enhanced slider styling with safety colors
-        speed_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: 2px solid #404040;
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #ff4757, stop: 0.3 #ffa502, stop: 0.6 #fffa65, stop: 1 #7bed9f);
-                height: 12px;
-                border-radius: 6px;
-            }
-            QSlider::handle:horizontal {
-                background: #ffffff;
-                border: 3px solid #0078d4;
-                width: 24px;
-                height: 24px;
-                margin: -8px 0;
-                border-radius: 12px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #e0e0e0;
-                border-color: #40a9ff;
-            }
-            QSlider::handle:horizontal:disabled {
-                background: #666666;
-                border-color: #404040;
-            }
-        """)
+        speed_slider.setObjectName("fanSlider")
         
         slider_container.addWidget(speed_slider)
         
         # Speed value display
         speed_value_label = QLabel(f"{pwm_percent}%")
-        speed_value_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #0078d4;
-            min-width: 50px;
-        """)
+        speed_value_label.setObjectName("fanSpeedValue")
+        speed_value_label.setPalette(self.fan_speed_palettes[None])
         slider_container.addWidget(speed_value_label)
         
         control_layout.addLayout(slider_container)
         
         # Safety warning label
         safety_label = QLabel("")
-        safety_label.setStyleSheet("""
-            font-size: 13px;
-            color: #ffa502;
-            font-weight: 600;
-            margin-top: 8px;
-        """)
+        safety_label.setObjectName("fanSafety")
         control_layout.addWidget(safety_label)
         
         # Apply button
         apply_btn = QPushButton("🔧 Apply Settings")
-        apply_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: #ffffff;
-                border: none;
-                padding: 12px 20px;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-                margin-top: 8px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #808080;
-            }
-        """)
+        apply_btn.setObjectName("fanApplyButton")
         apply_btn.clicked.connect(
             lambda: self.apply_fan_speed(fan_key, speed_slider.value())
         )
@@ -1461,31 +2169,30 @@ class PowerControlWidget(QWidget):
         control_group.setLayout(control_layout)
         main_layout.addWidget(control_group)
         
-        # Connect slider to update displays
-        def update_speed_display(value):
+        # Connect slider to update displays; a drag fires valueChanged for every step,
+        # so the preview is refreshed once the slider pauses for 50 ms
+        display_timer = QTimer(fan_card)
+        display_timer.setSingleShot(True)
+        display_timer.setInterval(50)
+        
+        def update_speed_display():
+            value = speed_slider.value()
             speed_value_label.setText(f"{value}%")
             
             # Update status color
-            color = "#7bed9f" if value > 60 else "#fffa65" if value > 30 else "#ff4757"
-            speed_value_label.setStyleSheet(f"""
-                font-size: 16px;
-                font-weight: 600;
-                color: {color};
-                min-width: 50px;
-            """)
+            band = fan_speed_band(value)
+            if speed_value_label.property('band') != band:
+                speed_value_label.setProperty('band', band)
+                speed_value_label.setPalette(self.fan_speed_palettes[band])
             
             # Update safety warnings
-            if value < 20:
-                safety_label.setText("⚠️ Low speed - Monitor temperatures closely!")
-                safety_label.setStyleSheet("font-size: 13px; color: #ff4757; font-weight: 600; margin-top: 8px;")
-            elif value < 40:
-                safety_label.setText("⚠️ Moderate speed - Watch temperatures")
-                safety_label.setStyleSheet("font-size: 13px; color: #ffa502; font-weight: 600; margin-top: 8px;")
-            else:
-                safety_label.setText("✅ Safe operating range")
-                safety_label.setStyleSheet("font-size: 13px; color: #7bed9f; font-weight: 600; margin-top: 8px;")
+            level, text = next((level, text) for limit, level, text in FAN_SAFETY_LEVELS if value < limit)
+            if safety_label.text() != text:
+                safety_label.setText(text)
+            set_style_state(safety_label, 'level', level)
         
-        speed_slider.valueChanged.connect(update_speed_display)
+        display_timer.timeout.connect(update_speed_display)
+        speed_slider.valueChanged.connect(lambda _: display_timer.start())
         
         fan_card.setLayout(main_layout)
         
@@ -1497,7 +2204,8 @@ class PowerControlWidget(QWidget):
             'speed_value_label': speed_value_label,
             'safety_label': safety_label,
             'apply_btn': apply_btn,
-            'status_label': status_label
+            'status_label': status_label,
+            'update_display': update_speed_display
         }
         
         return fan_card
@@ -1510,74 +2218,77 @@ class PowerControlWidget(QWidget):
         if hasattr(self, 'mode_description'):
             if is_manual:
                 self.mode_description.setText("👤 Manual mode: You control fan speeds manually - Monitor temperatures!")
-                self.mode_description.setStyleSheet("""
-                    font-size: 12px;
-                    color: #ffa502;
-                    font-weight: 500;
-                    margin-top: 8px;
-                    padding: 8px 12px;
-                    background-color: #1a1a1a;
-                    border-radius: 6px;
-                """)
             else:
                 self.mode_description.setText("🤖 Automatic mode: System controls fan speeds based on temperature")
-                self.mode_description.setStyleSheet("""
-                    font-size: 12px;
-                    color: #7bed9f;
-                    font-weight: 500;
-                    margin-top: 8px;
-                    padding: 8px 12px;
-                    background-color: #1a1a1a;
-                    border-radius: 6px;
-                """)
+            set_style_state(self.mode_description, 'mode', 'manual' if is_manual else 'automatic')
         
         # Enable/disable fan controls
         for fan_key, controls in self.fan_controllers.items():
             controls['speed_slider'].setEnabled(is_manual)
             controls['apply_btn'].setEnabled(is_manual)
     
+    def check_fan_safety(self):
+        """is_safe_to_control_fans(), reused for a second so repeated presses probe once"""
+        return _cached('fan_safety', 1.0, self.fan_controller.is_safe_to_control_fans)
+    
     def apply_fan_mode(self):
         """Apply fan mode to all controllable fans with error handling"""
-        if not hasattr(self, 'fan_controller'):
+        if self.fan_controller is None:
             QMessageBox.critical(self, "Error", "Fan controller not available")
             return
         
-        mode = self.fan_mode_combo.currentText().lower()
+        # The combo entries carry an emoji prefix; map them to the plain mode name
+        mode = "manual" if "Manual" in self.fan_mode_combo.currentText() else "automatic"
         
         # Safety check for manual mode
         if mode == "manual":
-            is_safe, safety_message = self.fan_controller.is_safe_to_control_fans()
+            is_safe, safety_message = self.check_fan_safety()
             if not is_safe:
                 QMessageBox.critical(self, "Safety Warning", 
                                    f"{safety_message}\n\nSwitching to manual mode is not recommended.")
                 return
         
-        success_count = 0
-        error_messages = []
-        
-        for fan_key in self.fan_controllers.keys():
-            success, message = self.fan_controller.set_fan_mode(fan_key, mode)
-            if success:
-                success_count += 1
-            else:
-                error_messages.append(f"{fan_key}: {message}")
+        fan_keys = list(self.fan_controllers.keys())
+        run_in_background(lambda: self.write_fan_modes(fan_keys, mode),
+                          lambda result, error: self.on_fan_mode_applied(mode, result, error))
+    
+    def write_fan_modes(self, fan_keys, mode):
+        """Runs on the thread pool: set mode on every fan in one privileged batch"""
+        return self.fan_controller.set_fan_modes(fan_keys, mode)
+    
+    def on_fan_mode_applied(self, mode, result, error):
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Error setting fan mode: {error}")
+            return
+        success_count, error_messages = result
         
+        # Report in the status bar; a modal box per mode change would block the window
+        parts = []
         if success_count > 0:
-            QMessageBox.information(self, "Success", 
-                                  f"Fan mode set to {mode} for {success_count} fans")
-        
+            parts.append(f"Fan mode set to {mode} for {success_count} fans")
         if error_messages:
-            QMessageBox.warning(self, "Partial Success", 
-                              "Some fans failed:\n" + "\n".join(error_messages[:5]))
+            parts.append(f"{len(error_messages)} failed: {error_messages[0]}")
+            print("Some fans failed:\n" + "\n".join(error_messages))
+        if not parts:
+            parts.append("No controllable fans")
+        self.show_status("; ".join(parts), 10000 if error_messages else 3000)
+    
+    def show_status(self, message, timeout=3000):
+        """Show a transient message in the main window's status bar"""
+        window = self.window()
+        if isinstance(window, QMainWindow):
+            window.statusBar().showMessage(message, timeout)
+        else:
+            print(message)
     
     def apply_fan_speed(self, fan_key, speed_percent):
         """Apply fan speed to a specific fan with safety checks"""
-        if not hasattr(self, 'fan_controller'):
+        if self.fan_controller is None:
             QMessageBox.critical(self, "Error", "Fan controller not available")
             return
         
         # Safety check
-        is_safe, safety_message = self.fan_controller.is_safe_to_control_fans()
+        is_safe, safety_message = self.check_fan_safety()
         if not is_safe:
             QMessageBox.critical(self, "Safety Warning", safety_message)
             return
@@ -1590,55 +2301,163 @@ class PowerControlWidget(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
         
-        success, message = self.fan_controller.set_fan_speed(fan_key, speed_percent)
-        
-        if success:
-            QMessageBox.information(self, "Success", message)
+        # Repeated presses within the debounce window collapse into one write per fan
+        self.pending_fan_speeds[fan_key] = speed_percent
+        self._fan_write_timer.start()
+    
+    def flush_fan_speeds(self):
+        """Write the latest queued speed for each fan and report once"""
+        pending, self.pending_fan_speeds = self.pending_fan_speeds, {}
+        if pending:
+            run_in_background(lambda: self.write_fan_speeds(pending), self.on_fan_speeds_applied)
+    
+    def write_fan_speeds(self, pending):
+        """Runs on the thread pool: write each queued speed"""
+        messages = []
+        all_ok = True
+        for fan_key, speed_percent in pending.items():
+            success, message = self.fan_controller.set_fan_speed(fan_key, speed_percent)
+            messages.append(message)
+            all_ok = all_ok and success
+        return messages, all_ok
+    
+    def on_fan_speeds_applied(self, result, error):
+        messages, all_ok = result if error is None else ([f"Error setting fan speed: {error}"], False)
+        if all_ok:
+            QMessageBox.information(self, "Success", "\n".join(messages))
         else:
-            QMessageBox.critical(self, "Error", message)
+            QMessageBox.critical(self, "Error", "\n".join(messages))
     
     def update_fan_status(self, controllable_fans):
-        """Update fan status display"""
-        for fan_key, fan_info in controllable_fans.items():
-            if fan_key in self.fan_controllers:
+        """Update fan status display, repainting the fan group once for all fans"""
+        self.fan_control_group.setUpdatesEnabled(False)
+        try:
+            for fan_key, fan_info in controllable_fans.items():
+                controls = self.fan_controllers.get(fan_key)
+                if controls is None:
+                    continue
                 current_pwm = fan_info.get('current_pwm', 0)
-                pwm_percent = round((current_pwm / 255) * 100)
+                pwm_percent = _PWM_PCT[min(current_pwm, 255)]
+                # Most ticks nothing moved; leave the card alone
+                if self.last_pwm_percent.get(fan_key) == pwm_percent:
+                    continue
                 
-                controls = self.fan_controllers[fan_key]
                 controls['pwm_label'].setText(f"{pwm_percent}%")
+                band = fan_speed_band(pwm_percent)
+                set_style_state(controls['pwm_label'], 'band', band)
+                set_style_state(controls['status_label'], 'band', band)
                 
-                # Update slider if not being dragged
-                if not controls['speed_slider'].isSliderDown():
-                    controls['speed_slider'].setValue(pwm_percent)
+                # Update slider if not being dragged; otherwise retry on the next update
+                slider = controls['speed_slider']
+                if slider.isSliderDown():
+                    continue
+                if slider.value() != pwm_percent:
+                    # The preview is refreshed directly instead of through valueChanged
+                    # and its debounce timer
+                    slider.blockSignals(True)
+                    slider.setValue(pwm_percent)
+                    slider.blockSignals(False)
+                    controls['update_display']()
+                self.last_pwm_percent[fan_key] = pwm_percent
+        finally:
+            self.fan_control_group.setUpdatesEnabled(True)
+    
+    def detect_backlight(self):
+        """Find the first usable backlight node and its max brightness"""
+        try:
+            devices = sorted(entry.name for entry in os.scandir(BACKLIGHT_CLASS))
+        except OSError:
+            return None, None
+        rank = {name: i for i, name in enumerate(BACKLIGHT_DEVICES)}
+        devices.sort(key=lambda name: rank.get(name, len(rank)))
+        
+        for name in devices:
+            device = os.path.join(BACKLIGHT_CLASS, name)
+            try:
+                with open(os.path.join(device, 'max_brightness'), 'r') as f:
+                    return os.path.join(device, 'brightness'), int(f.read().strip())
+            except (OSError, ValueError):
+                continue
+        return None, None
+    
+    def detect_xrandr(self):
+        """Open one RandR connection on X11 sessions when python-xlib is installed"""
+        if xdisplay is None or not os.environ.get('DISPLAY'):
+            return None
+        if os.environ.get('XDG_SESSION_TYPE') == 'wayland':
+            return None
+        try:
+            return XRandrBrightness()
+        except Exception as e:
+            print(f"RandR brightness control unavailable: {e}")
+            return None
     
     def change_brightness(self, value):
+        """Apply value on the thread pool; a change arriving meanwhile is applied after it"""
+        if value == self._last_brightness:
+            # Already applied or in flight; also drop a queued value it supersedes
+            self._queued_brightness = None
+            return
+        if self._brightness_busy:
+            self._queued_brightness = value
+            return
+        self._brightness_busy = True
+        self._last_brightness = value
+        run_in_background(lambda: self.write_brightness(value), self.on_brightness_written)
+    
+    def write_brightness(self, value):
+        """Runs on the thread pool: pkexec and xrandr may block for a polkit prompt or a probe"""
+        # Prefer the hardware backlight detected at startup
+        if self.backlight_path and self.set_backlight_brightness(value):
+            return True
+        return self.set_xrandr_brightness(value)
+    
+    def on_brightness_written(self, written, error):
+        self._brightness_busy = False
+        if error is not None:
+            print(f"Error changing brightness: {error}")
+        if error is not None or not written:
+            # Let the same value be tried again
+            self._last_brightness = None
+        if self._queued_brightness is not None:
+            value, self._queued_brightness = self._queued_brightness, None
+            self.change_brightness(value)
+    
+    def set_backlight_brightness(self, value):
+        new_brightness = int((value / 100) * self.backlight_max)
         try:
-            # Try different brightness control methods
-            brightness_paths = [
-                '/sys/class/backlight/intel_backlight/brightness',
-                '/sys/class/backlight/acpi_video0/brightness',
-                '/sys/class/backlight/amdgpu_bl0/brightness',
-                '/sys/class/backlight/nvidia_backlight/brightness'
-            ]
-            
-            # First try hardware backlight control
-            for path in brightness_paths:
-                if os.path.exists(path):
-                    max_brightness_path = path.replace('brightness', 'max_brightness')
-                    try:
-                        with open(max_brightness_path, 'r') as f:
-                            max_brightness = int(f.read().strip())
-                        
-                        new_brightness = int((value / 100) * max_brightness)
-                        cmd = f"echo {new_brightness} | pkexec tee {path}"
-                        subprocess.run(cmd, shell=True, check=True)
-                        return
-                    except:
-                        continue
-            
-            # Try to detect current display output
+            if self.write_backlight_direct(self.backlight_path, new_brightness):
+                return True
+            pkexec_write(self.backlight_path, new_brightness)
+            return True
+        except (OSError, subprocess.CalledProcessError):
+            return False
+    
+    def set_xrandr_brightness(self, value):
+        brightness_value = max(0.1, min(1.0, value/100))  # Clamp between 0.1 and 1.0
+        
+        # Reuse the RandR connection opened at startup when available
+        if self.xrandr is not None:
+            try:
+                self.xrandr.set_brightness(brightness_value)
+                return True
+            except Exception as e:
+                print(f"RandR brightness failed, falling back to xrandr: {e}")
+                self.xrandr = None
+        
+        # Reuse the output found by an earlier change instead of probing again
+        if self._xrandr_output is not None:
+            if self.run_xrandr_brightness(self._xrandr_output, brightness_value):
+                return True
+            self._xrandr_output = None
+        
+        # On X11 Qt names screens after their RandR outputs, so only ask xrandr when
+        # that name is unknown; --current reports the known configuration without
+        # polling the hardware
+        monitor_name = self._primary_output
+        if not monitor_name:
             try:
-                result = subprocess.run(['xrandr', '--listmonitors'], 
+                result = subprocess.run(['xrandr', '--listmonitors', '--current'], 
                                       capture_output=True, text=True)
                 if result.returncode == 0:
                     # Parse output to find active monitor
@@ -1651,25 +2470,490 @@ class PowerControlWidget(QWidget):
                         monitor_name = "HDMI-0"  # Default fallback
                 else:
                     monitor_name = "HDMI-0"
-            except:
+            except OSError:
                 monitor_name = "HDMI-0"
-            
-            # Fallback to xrandr with detected monitor
-            brightness_value = max(0.1, min(1.0, value/100))  # Clamp between 0.1 and 1.0
-            cmd = f"xrandr --output {monitor_name} --brightness {brightness_value}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                # Try common display names as fallback
-                common_names = ["HDMI-0", "HDMI-1", "HDMI-A-0", "eDP-1", "DP-1", "VGA-1"]
-                for name in common_names:
-                    cmd = f"xrandr --output {name} --brightness {brightness_value}"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        break
-                
-        except Exception as e:
-            print(f"Error changing brightness: {e}")
+        
+        # Fallback to xrandr with detected monitor, then common display names
+        common_names = ["HDMI-0", "HDMI-1", "HDMI-A-0", "eDP-1", "DP-1", "VGA-1"]
+        for name in [monitor_name] + [name for name in common_names if name != monitor_name]:
+            if self.run_xrandr_brightness(name, brightness_value):
+                self._xrandr_output = name
+                return True
+        return False
+    
+    def run_xrandr_brightness(self, output, brightness_value):
+        try:
+            result = subprocess.run(['xrandr', '--output', output, '--brightness', str(brightness_value)],
+                                    capture_output=True, text=True)
+        except OSError:
+            return False
+        return result.returncode == 0
+    
+    def forget_xrandr_output(self, _screen=None):
+        """Screens changed: detect the output again on the next change"""
+        self._xrandr_output = None
+        # Read here, on the GUI thread; the brightness write runs on the thread pool
+        screen = QApplication.primaryScreen()
+        self._primary_output = screen.name() if screen is not None else ""
+
+# Modern dark theme, parsed once and applied app-wide from main()
+APP_STYLESHEET = """
+    /* Main Window */
+    QMainWindow {
+        background-color: #1a1a1a;
+        color: #ffffff;
+        font-family: 'Segoe UI', 'San Francisco', 'Arial', sans-serif;
+    }
+    
+    /* Tab Widget */
+    QTabWidget::pane {
+        border: 1px solid #333333;
+        background-color: #1a1a1a;
+        border-radius: 8px;
+    }
+    
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        padding: 12px 24px;
+        margin-right: 4px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        font-size: 14px;
+        font-weight: 500;
+        min-width: 120px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+        border-bottom: 3px solid #106ebe;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        background-color: #404040;
+        color: #ffffff;
+    }
+    
+    /* Group Boxes */
+    QGroupBox {
+        font-weight: 600;
+        font-size: 16px;
+        border: 2px solid #404040;
+        border-radius: 12px;
+        margin-top: 16px;
+        padding-top: 16px;
+        color: #ffffff;
+        background-color: #242424;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 20px;
+        padding: 0 8px 0 8px;
+        color: #0078d4;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #0078d4;
+        color: #ffffff;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-weight: 600;
+        font-size: 14px;
+        min-height: 20px;
+    }
+    
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    
+    QPushButton:disabled {
+        background-color: #666666;
+        color: #999999;
+    }
+    
+    /* Progress Bars */
+    QProgressBar {
+        border: 2px solid #404040;
+        border-radius: 8px;
+        text-align: center;
+        color: #ffffff;
+        font-weight: 600;
+        background-color: #2d2d2d;
+        height: 24px;
+    }
+    
+    QProgressBar::chunk {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #0078d4, stop: 1 #40a9ff);
+        border-radius: 6px;
+    }
+    
+    /* Labels; their default text color is the application palette's, see main() */
+    QLabel {
+        font-size: 14px;
+    }
+    
+    /* Text Edits */
+    QTextEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        color: #ffffff;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 13px;
+        padding: 8px;
+    }
+    
+    /* Sliders */
+    QSlider::groove:horizontal {
+        border: 1px solid #404040;
+        height: 8px;
+        background: #2d2d2d;
+        border-radius: 4px;
+    }
+    
+    QSlider::handle:horizontal {
+        background: #0078d4;
+        border: 2px solid #ffffff;
+        width: 20px;
+        height: 20px;
+        margin: -7px 0;
+        border-radius: 10px;
+    }
+    
+    QSlider::handle:horizontal:hover {
+        background: #40a9ff;
+    }
+    
+    QSlider::sub-page:horizontal {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #0078d4, stop: 1 #40a9ff);
+        border-radius: 4px;
+    }
+    
+    /* Combo Boxes */
+    QComboBox {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #ffffff;
+        font-size: 14px;
+        min-width: 120px;
+    }
+    
+    QComboBox:hover {
+        border-color: #0078d4;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #ffffff;
+        margin-right: 5px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        color: #ffffff;
+        selection-background-color: #0078d4;
+    }
+    
+    /* Spin Boxes */
+    QSpinBox {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        color: #ffffff;
+        font-size: 14px;
+    }
+    
+    QSpinBox:hover {
+        border-color: #0078d4;
+    }
+    
+    /* Checkboxes */
+    QCheckBox {
+        color: #ffffff;
+        font-size: 14px;
+    }
+    
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #404040;
+        border-radius: 4px;
+        background-color: #2d2d2d;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+    }
+    
+    QCheckBox::indicator:checked:hover {
+        background-color: #40a9ff;
+    }
+    
+    /* Scrollbars */
+    QScrollBar:vertical {
+        background-color: #2d2d2d;
+        width: 12px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #0078d4;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #40a9ff;
+    }
+    
+    QScrollBar::add-line:vertical,
+    QScrollBar::sub-line:vertical {
+        height: 0px;
+    }    
+    /* Cards: widgets pick these up through setObjectName() */
+    QWidget#card, QWidget#fanModeCard, QWidget#fanCard {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 16px;
+        padding: 20px;
+    }
+    
+    QWidget#fanModeCard, QWidget#fanCard {
+        margin: 8px;
+    }
+    
+    QWidget#card:hover, QWidget#fanModeCard:hover, QWidget#fanCard:hover {
+        border-color: #0078d4;
+    }
+    
+    QWidget#fanCard:hover {
+        background-color: #323232;
+    }
+    
+    QWidget#metricCard {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 12px;
+    }
+    
+    QWidget#metricCard:hover {
+        border-color: #0078d4;
+    }
+    
+    QWidget#fanControlGroup {
+        background-color: #1a1a1a;
+        border: 1px solid #404040;
+        border-radius: 12px;
+        padding: 16px;
+    }
+    
+    QLabel#cardIcon {
+        font-size: 24px;
+    }
+    
+    QLabel#cardTitle {
+        font-size: 18px;
+        font-weight: 600;
+        color: #ffffff;
+        margin-left: 8px;
+    }
+    
+    QLabel#fieldLabel {
+        font-weight: 500;
+        color: #cccccc;
+    }
+    
+    QLabel#sectionLabel {
+        color: #ffffff;
+        font-weight: 600;
+        margin-bottom: 8px;
+    }
+    
+    QLabel#accentValue {
+        font-weight: 600;
+        color: #0078d4;
+    }
+    
+    QLabel#sliderValue {
+        font-weight: 600;
+        color: #0078d4;
+        min-width: 40px;
+    }
+    
+    /* Metric cards */
+    QLabel#metricTitle {
+        font-weight: 600;
+        color: #ffffff;
+        padding: 2px 0px;
+    }
+    
+    QLabel#metricValue {
+        font-size: 12px;
+        color: #cccccc;
+        font-weight: 500;
+        padding: 2px 0px;
+    }
+    
+    QProgressBar#metricProgress {
+        border-radius: 6px;
+        font-size: 12px;
+        background-color: #1a1a1a;
+    }
+    
+    QProgressBar#metricProgress::chunk {
+        border-radius: 4px;
+    }
+    
+    /* Sensor reading grids */
+    QScrollArea#readingArea {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+    }
+    
+    QScrollArea#readingArea > QWidget > QWidget {
+        background-color: #2d2d2d;
+    }
+    
+    QLabel#readingHeader {
+        font-weight: bold;
+        margin-top: 4px;
+    }
+    
+    QLabel#readingName {
+        color: #cccccc;
+        font-size: 13px;
+    }
+    
+    QLabel#fanPlaceholder {
+        font-size: 13px;
+    }
+    
+    QLabel#readingValue {
+        color: #0078d4;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    
+    QLabel#readingValue[temp="normal"], QLabel#readingValue[band="high"] { color: #7bed9f; }
+    QLabel#readingValue[temp="warm"] { color: #fffa65; }
+    QLabel#readingValue[temp="hot"], QLabel#readingValue[band="medium"] { color: #ffa502; }
+    QLabel#readingValue[temp="critical"], QLabel#readingValue[band="low"] { color: #ff4757; }
+    
+    /* Fan control; [band=...], [level=...] and [mode=...] follow the readings */
+    QComboBox#fanModeCombo {
+        background-color: #1a1a1a;
+        font-weight: 500;
+        min-width: 150px;
+    }
+    
+    QPushButton#fanModeButton {
+        padding: 10px 20px;
+    }
+    
+    QPushButton#fanApplyButton {
+        padding: 12px 20px;
+        margin-top: 8px;
+    }
+    
+    QPushButton#fanApplyButton:disabled {
+        background-color: #404040;
+        color: #808080;
+    }
+    
+    QSlider#fanSlider::groove:horizontal {
+        border: 2px solid #404040;
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #ff4757, stop: 0.3 #ffa502, stop: 0.6 #fffa65, stop: 1 #7bed9f);
+        height: 12px;
+        border-radius: 6px;
+    }
+    
+    QSlider#fanSlider::handle:horizontal {
+        background: #ffffff;
+        border: 3px solid #0078d4;
+        width: 24px;
+        height: 24px;
+        margin: -8px 0;
+        border-radius: 12px;
+    }
+    
+    QSlider#fanSlider::handle:horizontal:hover {
+        background: #e0e0e0;
+        border-color: #40a9ff;
+    }
+    
+    QSlider#fanSlider::handle:horizontal:disabled {
+        background: #666666;
+        border-color: #404040;
+    }
+    
+    QLabel#fanModeDescription {
+        font-size: 12px;
+        font-weight: 500;
+        margin-top: 8px;
+        padding: 8px 12px;
+        background-color: #1a1a1a;
+        border-radius: 6px;
+    }
+    
+    QLabel#fanModeDescription[mode="automatic"] { color: #7bed9f; }
+    QLabel#fanModeDescription[mode="manual"] { color: #ffa502; }
+    
+    /* No color here: the slider preview swaps palettes (FAN_SPEED_COLORS) while dragging */
+    QLabel#fanSpeedValue {
+        font-size: 16px;
+        font-weight: 600;
+        min-width: 50px;
+    }
+    
+    QLabel#fanSafety {
+        font-size: 13px;
+        color: #ffa502;
+        font-weight: 600;
+        margin-top: 8px;
+    }
+    
+    QLabel#fanSafety[level="low"] { color: #ff4757; }
+    QLabel#fanSafety[level="moderate"] { color: #ffa502; }
+    QLabel#fanSafety[level="safe"] { color: #7bed9f; }
+    
+    QLabel#fanStatus {
+        font-size: 20px;
+    }
+    
+    QLabel#fanPwm {
+        font-size: 16px;
+        font-weight: 600;
+    }
+    
+    QLabel#fanStatus[band="high"], QLabel#fanPwm[band="high"] { color: #00ff00; }
+    QLabel#fanStatus[band="medium"], QLabel#fanPwm[band="medium"] { color: #ffff00; }
+    QLabel#fanStatus[band="low"], QLabel#fanPwm[band="low"] { color: #ff6b6b; }
+"""
 
 class LenovoControlCenter(QMainWindow):
     def __init__(self):
@@ -1691,257 +2975,84 @@ class LenovoControlCenter(QMainWindow):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Add tabs
+        # Add tabs; only the first is built now, the rest on first activation
         self.system_info_widget = SystemInfoWidget()
         self.tab_widget.addTab(self.system_info_widget, "System Info")
-        self.tab_widget.addTab(BatteryControlWidget(), "Battery")
-        self.tab_widget.addTab(PowerControlWidget(), "Power & Display")
-        self.tab_widget.addTab(GPUControlWidget(self.system_info_widget.monitor_thread.gpu_controller), "GPU")
+        self.tabs = {0: self.system_info_widget}
+        self.tab_factories = {
+            1: ("Battery", BatteryControlWidget),
+            2: ("Power & Display", lambda: PowerControlWidget(self.system_info_widget.fan_controller)),
+            3: ("GPU", lambda: GPUControlWidget(self.system_info_widget.gpu_controller)),
+        }
+        for index in sorted(self.tab_factories):
+            self.tab_widget.addTab(QWidget(), self.tab_factories[index][0])
+        
+        self.stats_bus = SystemStatsBus.instance()
+        self.tab_widget.currentChanged.connect(self.materialize_tab)
+        self.tab_widget.currentChanged.connect(self.update_polling)
         
         layout.addWidget(self.tab_widget)
+    
+    def materialize_tab(self, index):
+        """Replace a placeholder tab with its real widget the first time it is shown"""
+        if index in self.tabs or index not in self.tab_factories:
+            return
         
-        # Set modern dark theme
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                font-family: 'Segoe UI', 'San Francisco', 'Arial', sans-serif;
-            }
-            
-            /* Tab Widget */
-            QTabWidget::pane {
-                border: 1px solid #333333;
-                background-color: #1a1a1a;
-                border-radius: 8px;
-            }
-            
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                padding: 12px 24px;
-                margin-right: 4px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 120px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-                color: #ffffff;
-                border-bottom: 3px solid #106ebe;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            
-            /* Group Boxes */
-            QGroupBox {
-                font-weight: 600;
-                font-size: 16px;
-                border: 2px solid #404040;
-                border-radius: 12px;
-                margin-top: 16px;
-                padding-top: 16px;
-                color: #ffffff;
-                background-color: #242424;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 20px;
-                padding: 0 8px 0 8px;
-                color: #0078d4;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #0078d4;
-                color: #ffffff;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            
-            QPushButton:disabled {
-                background-color: #666666;
-                color: #999999;
-            }
-            
-            /* Progress Bars */
-            QProgressBar {
-                border: 2px solid #404040;
-                border-radius: 8px;
-                text-align: center;
-                color: #ffffff;
-                font-weight: 600;
-                background-color: #2d2d2d;
-                height: 24px;
-            }
-            
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0078d4, stop: 1 #40a9ff);
-                border-radius: 6px;
-            }
-            
-            /* Labels */
-            QLabel {
-                color: #ffffff;
-                font-size: 14px;
-            }
-            
-            /* Text Edits */
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                color: #ffffff;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 13px;
-                padding: 8px;
-            }
-            
-            /* Sliders */
-            QSlider::groove:horizontal {
-                border: 1px solid #404040;
-                height: 8px;
-                background: #2d2d2d;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #0078d4;
-                border: 2px solid #ffffff;
-                width: 20px;
-                height: 20px;
-                margin: -7px 0;
-                border-radius: 10px;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: #40a9ff;
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0078d4, stop: 1 #40a9ff);
-                border-radius: 4px;
-            }
-            
-            /* Combo Boxes */
-            QComboBox {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #ffffff;
-                font-size: 14px;
-                min-width: 120px;
-            }
-            
-            QComboBox:hover {
-                border-color: #0078d4;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                color: #ffffff;
-                selection-background-color: #0078d4;
-            }
-            
-            /* Spin Boxes */
-            QSpinBox {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            
-            QSpinBox:hover {
-                border-color: #0078d4;
-            }
-            
-            /* Checkboxes */
-            QCheckBox {
-                color: #ffffff;
-                font-size: 14px;
-            }
-            
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #404040;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-            
-            QCheckBox::indicator:checked:hover {
-                background-color: #40a9ff;
-            }
-            
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #0078d4;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #40a9ff;
-            }
-            
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        name, factory = self.tab_factories[index]
+        # Factories take the bus's controllers, which exist only after hardware detection
+        self.stats_bus.detect_hardware()
+        widget = factory()
+        self.tabs[index] = widget
+        
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, name)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def update_polling(self):
+        """Only run the pollers whose data is currently on screen"""
+        visible = self.isVisible() and not self.isMinimized()
+        current = self.tab_widget.currentWidget()
+        self.stats_bus.set_active(visible and isinstance(current, (SystemInfoWidget, BatteryControlWidget)))
+        power_widget = self.tabs.get(2)
+        if power_widget is not None:
+            power_widget.set_interval_multiplier(self.poll_multiplier())
+            power_widget.set_polling(visible and current is power_widget)
+    
+    def poll_multiplier(self):
+        """Poll 5x slower while the window is in the background, and 2x slower on battery"""
+        multiplier = 1 if self.isActiveWindow() else 5
+        # Any reading the stats bus took in the last 30 s is recent enough here
+        battery = BATTERY_READER.read_cached(30)
+        # None means "Not charging"/"Unknown", typically AC power held by a charge threshold
+        if battery is not None and battery.power_plugged is False:
+            multiplier *= 2
+        return multiplier
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_polling()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_polling()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.ActivationChange):
+            self.update_polling()
 
 def main():
     app = QApplication(sys.argv)
+    # Label text color comes from the palette rather than a style sheet rule, so a
+    # label can be recolored with setPalette() without re-polishing it
+    palette = app.palette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor("#ffffff"))
+    app.setPalette(palette)
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Check for required dependencies
     try:
@@ -8,41 +8,162 @@ import time
 import psutil
 import platform
 import os
+import glob
+from concurrent.futures import ThreadPoolExecutor
+
+# Monitor passes between samples of the slower-changing readings
+DISK_SAMPLE_EVERY = 15
+TEMP_SAMPLE_EVERY = 5
+
+BACKLIGHT_PATHS = [
+    '/sys/class/backlight/intel_backlight/brightness',
+    '/sys/class/backlight/acpi_video0/brightness',
+    '/sys/class/backlight/amdgpu_bl0/brightness'
+]
+
+def read_sysfs(path):
+    # Contents of a sysfs attribute, or None if it is missing or unreadable
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def pkexec_write(writes):
+    # Write every (path, value) pair from a single root shell, so the user
+    # is asked to authenticate once. Values and paths are passed as
+    # positional arguments rather than spliced into the script.
+    script = ' && '.join(f'echo "${{{i * 2 + 1}}}" > "${{{i * 2 + 2}}}"'
+                         for i in range(len(writes)))
+    args = [str(item) for path, value in writes for item in (value, path)]
+    subprocess.run(['pkexec', 'sh', '-c', script, 'sh'] + args, check=True)
 
 class SystemMonitor:
-    def __init__(self):
+    def __init__(self, min_interval=2, max_interval=30, is_hidden=None, schedule=None):
         self.running = False
         self.callbacks = []
+        # Hands a function to the UI thread (root.after_idle); callbacks run
+        # on the monitor thread when no scheduler is given
+        self.schedule = schedule
+        self._latest = None
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # Returns True while the window is minimized and nothing is on screen
+        self.is_hidden = is_hidden or (lambda: False)
+        self._wake_event = threading.Event()
+        self._cpu_percent = 0.0
+        self._cpu_sampled_at = 0.0
+        # Disk usage and hwmon readings change slowly, so they are refreshed
+        # every few passes and the last values are reused in between
+        self._disk_skip = 0
+        self._temp_skip = 0
+        self._disk = None
+        self._temperatures = None
     
     def add_callback(self, callback):
         self.callbacks.append(callback)
     
     def start(self):
         self.running = True
+        self._wake_event.clear()
+        # The first non-blocking call only sets the baseline for the next one
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
     
     def stop(self):
         self.running = False
+        self._wake_event.set()
+    
+    def wake(self):
+        # Cut the current wait short, e.g. when the window is restored
+        self._wake_event.set()
+    
+    def _poll_interval(self, battery):
+        # Poll quickly only while plugged in and visible, back off otherwise
+        if self.is_hidden():
+            return self.max_interval
+        # power_plugged is None for "Not charging", which is how a machine on AC
+        # reports itself while a charge threshold holds the battery
+        if battery and battery.power_plugged is False:
+            return min(self.min_interval * 5, self.max_interval)
+        return self.min_interval
+    
+    def _sample_cpu(self):
+        # cpu_percent(None) reports usage since the previous call, which is
+        # meaningless over very short spans, so keep the last value until then
+        now = time.monotonic()
+        if now - self._cpu_sampled_at >= 0.5:
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = now
+        return self._cpu_percent
+    
+    def _sample_disk(self):
+        if self._disk is None or self._disk_skip == 0:
+            self._disk = psutil.disk_usage('/')
+        self._disk_skip = (self._disk_skip + 1) % DISK_SAMPLE_EVERY
+        return self._disk
+    
+    def _sample_temperatures(self):
+        if self._temperatures is None or self._temp_skip == 0:
+            self._temperatures = psutil.sensors_temperatures()
+        self._temp_skip = (self._temp_skip + 1) % TEMP_SAMPLE_EVERY
+        return self._temperatures
+    
+    def _publish(self, data):
+        if self.schedule is None:
+            for callback in self.callbacks:
+                callback(data)
+            return
+        
+        # Keep only the newest sample; one pending flush delivers it, so
+        # samples arriving while the UI is busy replace each other
+        with self._lock:
+            self._latest = data
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.schedule(self._flush)
+        except Exception:
+            with self._lock:
+                self._scheduled = False
+            raise
+    
+    def _flush(self):
+        with self._lock:
+            data = self._latest
+            self._latest = None
+            self._scheduled = False
+        if data is None:
+            return
+        for callback in self.callbacks:
+            callback(data)
     
     def _monitor_loop(self):
         while self.running:
+            interval = self.min_interval
             try:
                 data = {
-                    'cpu_percent': psutil.cpu_percent(interval=1),
+                    'cpu_percent': self._sample_cpu(),
                     'memory': psutil.virtual_memory(),
-                    'disk': psutil.disk_usage('/'),
+                    'disk': self._sample_disk(),
                     'battery': psutil.sensors_battery(),
-                    'temperatures': psutil.sensors_temperatures(),
+                    'temperatures': self._sample_temperatures(),
                 }
                 
-                for callback in self.callbacks:
-                    callback(data)
+                self._publish(data)
+                
+                interval = self._poll_interval(data['battery'])
                     
             except Exception as e:
                 print(f"Monitor error: {e}")
             
-            time.sleep(2)
+            self._wake_event.wait(interval)
+            self._wake_event.clear()
 
 class LenovoControlCenter:
     def __init__(self):
@@ -56,12 +177,30 @@ class LenovoControlCenter:
         self.style.theme_use('clam')
         self.configure_styles()
         
-        self.monitor = SystemMonitor()
+        self.minimized = False
+        self.root.bind('<Unmap>', self.on_unmap)
+        self.root.bind('<Map>', self.on_map)
+        
+        self.monitor = SystemMonitor(is_hidden=lambda: self.minimized,
+                                     schedule=self.root.after_idle)
         self.monitor.add_callback(self.update_system_info)
         
+        # Every privileged or blocking write goes through this one worker,
+        # which keeps them off the Tk thread and in order
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        
         self.create_widgets()
         self.monitor.start()
     
+    def on_unmap(self, event):
+        if event.widget is self.root:
+            self.minimized = True
+    
+    def on_map(self, event):
+        if event.widget is self.root and self.minimized:
+            self.minimized = False
+            self.monitor.wake()
+    
     def configure_styles(self):
         # Configure dark theme
         self.style.configure('TNotebook', background='#2b2b2b')
@@ -93,6 +232,9 @@ class LenovoControlCenter:
         self.power_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.power_frame, text="Power & Display")
         self.create_power_tab()
+        
+        self.latest_system_data = None
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
     
     def create_system_tab(self):
         # System Overview
@@ -130,6 +272,8 @@ class LenovoControlCenter:
         
         self.temp_text = scrolledtext.ScrolledText(temp_frame, height=8, bg='#3c3c3c', fg='white')
         self.temp_text.pack(fill='both', expand=True)
+        self.last_temp_lines = []
+        self.last_battery_text = None
     
     def create_battery_tab(self):
         # Battery Thresholds
@@ -155,6 +299,7 @@ class LenovoControlCenter:
         
         self.battery_info_text = scrolledtext.ScrolledText(info_frame, height=10, bg='#3c3c3c', fg='white')
         self.battery_info_text.pack(fill='both', expand=True)
+        self.cached_thresholds = None
         
         self.update_battery_info()
     
@@ -179,16 +324,37 @@ class LenovoControlCenter:
         brightness_frame = ttk.LabelFrame(self.power_frame, text="Display Brightness", padding=10)
         brightness_frame.pack(fill='x', padx=10, pady=5)
         
-        ttk.Label(brightness_frame, text="Brightness:").pack(anchor='w')
+        self.brightness_label = ttk.Label(brightness_frame, text="Brightness: 50%")
+        self.brightness_label.pack(anchor='w')
         self.brightness_var = tk.IntVar(value=50)
+        # Dragging only updates the label; the value is written on release
         self.brightness_scale = ttk.Scale(brightness_frame, from_=1, to=100, variable=self.brightness_var, 
-                                         command=self.change_brightness, orient='horizontal', length=400)
+                                         command=self.preview_brightness, orient='horizontal', length=400)
         self.brightness_scale.pack(fill='x', pady=5)
+        self.brightness_scale.bind('<ButtonRelease-1>', lambda e: self.change_brightness(self.brightness_scale.get()))
+        # Arrow keys move a focused Scale too; write once the key is let go
+        self.brightness_scale.bind('<KeyRelease>', lambda e: self.change_brightness(self.brightness_scale.get()))
+        self.last_brightness = None
+        self.xrandr_output = None
+        self.backlight_fd = None
+        self.detect_backlight()
+        if not self.backlight_path:
+            self.executor.submit(self.detect_xrandr_output)
         
         self.load_governors()
         self.update_current_governor()
     
+    def on_tab_changed(self, event):
+        # Samples were skipped while the System tab was hidden; show the latest now
+        if self.latest_system_data is not None:
+            self.update_system_info(self.latest_system_data)
+    
     def update_system_info(self, data):
+        # Hidden widgets still relayout on config(), so leave them alone
+        self.latest_system_data = data
+        if self.notebook.select() != str(self.system_frame):
+            return
+        
         try:
             # Update CPU
             cpu_percent = data['cpu_percent']
@@ -197,13 +363,13 @@ class LenovoControlCenter:
             
             # Update Memory
             memory = data['memory']
-            memory_percent = (memory.used / memory.total) * 100
+            memory_percent = memory.percent
             self.memory_progress['value'] = memory_percent
             self.memory_label.config(text=f"{memory_percent:.1f}%")
             
             # Update Disk
             disk = data['disk']
-            disk_percent = (disk.used / disk.total) * 100
+            disk_percent = disk.percent
             self.disk_progress['value'] = disk_percent
             self.disk_label.config(text=f"{disk_percent:.1f}%")
             
@@ -211,23 +377,54 @@ class LenovoControlCenter:
             battery = data['battery']
             if battery:
                 status = "Charging" if battery.power_plugged else "Discharging"
-                self.battery_info_label.config(text=f"Battery: {battery.percent}% ({status})")
+                battery_text = f"Battery: {battery.percent}% ({status})"
             else:
-                self.battery_info_label.config(text="Battery: N/A")
+                battery_text = "Battery: N/A"
+            if battery_text != self.last_battery_text:
+                self.battery_info_label.config(text=battery_text)
+                self.last_battery_text = battery_text
             
             # Update Temperatures
             temps = data['temperatures']
-            temp_text = ""
-            for name, entries in temps.items():
-                for entry in entries:
-                    temp_text += f"{name}: {entry.current}°C\n"
+            temp_lines = [f"{name}: {entry.current}°C"
+                          for name, entries in temps.items() for entry in entries]
             
-            self.temp_text.delete(1.0, tk.END)
-            self.temp_text.insert(1.0, temp_text)
+            # Rewriting the text widget forces a relayout, so only do it on change
+            if temp_lines != self.last_temp_lines:
+                self.update_temp_text(temp_lines)
             
         except Exception as e:
             print(f"Error updating UI: {e}")
     
+    def update_temp_text(self, temp_lines):
+        # Edit only the lines that changed; Text reflows just the edited region
+        previous = self.last_temp_lines
+        for i, (old, new) in enumerate(zip(previous, temp_lines)):
+            if old != new:
+                self.temp_text.replace(f'{i + 1}.0', f'{i + 1}.end', new)
+        if len(temp_lines) > len(previous):
+            self.temp_text.insert('end-1c', "".join(f"{line}\n" for line in temp_lines[len(previous):]))
+        elif len(temp_lines) < len(previous):
+            self.temp_text.delete(f'{len(temp_lines) + 1}.0', 'end-1c')
+        self.last_temp_lines = temp_lines
+    
+    def run_privileged(self, action, on_success, failure_text, on_error=None):
+        # The pkexec prompt can stay up for seconds, so the action runs on
+        # the worker and its outcome is handed back to the Tk thread
+        future = self.executor.submit(action)
+        future.add_done_callback(lambda f: self.root.after(
+            0, self.on_privileged_result, f.exception(), on_success, failure_text, on_error))
+    
+    def on_privileged_result(self, error, on_success, failure_text, on_error=None):
+        if error is None:
+            on_success()
+        elif on_error is not None:
+            on_error(error)
+        elif isinstance(error, subprocess.CalledProcessError):
+            messagebox.showerror("Error", failure_text)
+        else:
+            messagebox.showerror("Error", f"Unexpected error: {str(error)}")
+    
     def apply_battery_thresholds(self):
         try:
             start_val = int(self.start_threshold.get())
@@ -237,72 +434,64 @@ class LenovoControlCenter:
                 messagebox.showerror("Error", "Start threshold must be less than stop threshold!")
                 return
             
-            # Apply thresholds
-            start_cmd = f"echo {start_val} | pkexec tee /sys/class/power_supply/BAT0/charge_start_threshold"
-            stop_cmd = f"echo {stop_val} | pkexec tee /sys/class/power_supply/BAT0/charge_stop_threshold"
-            
-            subprocess.run(start_cmd, shell=True, check=True)
-            subprocess.run(stop_cmd, shell=True, check=True)
-            
-            messagebox.showinfo("Success", f"Battery thresholds set: {start_val}% - {stop_val}%")
-            self.update_battery_info()
+            # Apply both thresholds with one authentication
+            writes = [
+                ('/sys/class/power_supply/BAT0/charge_start_threshold', start_val),
+                ('/sys/class/power_supply/BAT0/charge_stop_threshold', stop_val),
+            ]
+            self.run_privileged(lambda: pkexec_write(writes),
+                                lambda: self.on_thresholds_applied(start_val, stop_val),
+                                "Failed to apply battery thresholds. Check permissions.")
             
-        except subprocess.CalledProcessError:
-            messagebox.showerror("Error", "Failed to apply battery thresholds. Check permissions.")
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
     
+    def on_thresholds_applied(self, start_val, stop_val):
+        self.cached_thresholds = (str(start_val), str(stop_val))
+        messagebox.showinfo("Success", f"Battery thresholds set: {start_val}% - {stop_val}%")
+        self.update_battery_info()
+    
     def update_battery_info(self):
         try:
-            info_text = ""
+            lines = []
             
             # Battery info
             battery = psutil.sensors_battery()
             if battery:
-                info_text += f"Battery Percentage: {battery.percent}%\n"
-                info_text += f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n"
+                lines.append(f"Battery Percentage: {battery.percent}%\n")
+                lines.append(f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n")
                 if battery.secsleft != psutil.POWER_TIME_UNLIMITED:
                     hours, remainder = divmod(battery.secsleft, 3600)
                     minutes, _ = divmod(remainder, 60)
-                    info_text += f"Time Remaining: {hours:02d}:{minutes:02d}\n"
-            
-            # Current thresholds
-            try:
-                with open('/sys/class/power_supply/BAT0/charge_start_threshold', 'r') as f:
-                    start = f.read().strip()
-                    info_text += f"Current Start Threshold: {start}%\n"
-            except:
-                info_text += "Current Start Threshold: N/A\n"
+                    lines.append(f"Time Remaining: {hours:02d}:{minutes:02d}\n")
             
-            try:
-                with open('/sys/class/power_supply/BAT0/charge_stop_threshold', 'r') as f:
-                    stop = f.read().strip()
-                    info_text += f"Current Stop Threshold: {stop}%\n"
-            except:
-                info_text += "Current Stop Threshold: N/A\n"
+            # Current thresholds, read from sysfs only until we set them ourselves
+            if self.cached_thresholds is None:
+                self.cached_thresholds = (read_sysfs('/sys/class/power_supply/BAT0/charge_start_threshold'),
+                                          read_sysfs('/sys/class/power_supply/BAT0/charge_stop_threshold'))
+            start, stop = self.cached_thresholds
+            lines.append(f"Current Start Threshold: {start}%\n" if start is not None
+                         else "Current Start Threshold: N/A\n")
+            lines.append(f"Current Stop Threshold: {stop}%\n" if stop is not None
+                         else "Current Stop Threshold: N/A\n")
             
             self.battery_info_text.delete(1.0, tk.END)
-            self.battery_info_text.insert(1.0, info_text)
+            self.battery_info_text.insert(1.0, "".join(lines))
             
         except Exception as e:
             self.battery_info_text.delete(1.0, tk.END)
             self.battery_info_text.insert(1.0, f"Error reading battery info: {str(e)}")
     
     def load_governors(self):
-        try:
-            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors', 'r') as f:
-                governors = f.read().strip().split()
-                self.governor_combo['values'] = governors
-        except:
+        governors = read_sysfs('/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors')
+        if governors:
+            self.governor_combo['values'] = governors.split()
+        else:
             self.governor_combo['values'] = ['performance', 'powersave', 'ondemand', 'conservative']
     
     def update_current_governor(self):
-        try:
-            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor', 'r') as f:
-                current = f.read().strip()
-                self.current_governor_label.config(text=current)
-        except:
-            self.current_governor_label.config(text="N/A")
+        current = read_sysfs('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor')
+        self.current_governor_label.config(text=current or "N/A")
     
     def apply_cpu_governor(self):
         try:
@@ -311,71 +500,114 @@ class LenovoControlCenter:
                 messagebox.showerror("Error", "Please select a governor!")
                 return
                 
-            cmd = f"echo {governor} | pkexec tee /sys/devices/system/cpu/cpu*/cpufreq/scaling_governor"
-            subprocess.run(cmd, shell=True, check=True)
-            self.update_current_governor()
-            messagebox.showinfo("Success", f"CPU governor set to: {governor}")
-        except subprocess.CalledProcessError:
-            messagebox.showerror("Error", "Failed to set CPU governor. Check permissions.")
+            paths = sorted(glob.glob('/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor'))
+            if not paths:
+                messagebox.showerror("Error", "No CPU frequency governors found on this system.")
+                return
+            writes = [(path, governor) for path in paths]
+            self.run_privileged(lambda: pkexec_write(writes),
+                                lambda: self.on_governor_applied(governor),
+                                "Failed to set CPU governor. Check permissions.")
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
     
+    def on_governor_applied(self, governor):
+        self.update_current_governor()
+        messagebox.showinfo("Success", f"CPU governor set to: {governor}")
+    
+    def detect_backlight(self):
+        # Resolve the backlight once; the slider reuses it for every write
+        self.backlight_path = None
+        self.max_brightness = None
+        for path in BACKLIGHT_PATHS:
+            max_brightness = read_sysfs(os.path.join(os.path.dirname(path), 'max_brightness'))
+            if max_brightness and max_brightness.isdigit():
+                self.max_brightness = int(max_brightness)
+                self.backlight_path = path
+                return
+    
+    def preview_brightness(self, value):
+        self.brightness_label.config(text=f"Brightness: {int(float(value))}%")
+    
     def change_brightness(self, value):
+        # A click without moving the slider changes nothing
+        value = int(float(value))
+        if value == self.last_brightness:
+            return
+        # pkexec and xrandr both block, so the write runs on the worker
+        # Failures are shown next to the slider; a dialog per release would be too much
+        self.run_privileged(lambda: self.write_brightness(value),
+                            lambda: self.on_brightness_written(value),
+                            "Failed to change brightness. Check permissions.",
+                            lambda error: self.on_brightness_failed(value, error))
+    
+    def on_brightness_written(self, value):
+        # Only a value that reached the display is skipped next time
+        self.last_brightness = value
+    
+    def on_brightness_failed(self, value, error):
+        self.brightness_label.config(text=f"Brightness: {value}% (not applied)")
+        print(f"Error changing brightness: {error}")
+    
+    def detect_xrandr_output(self):
         try:
-            brightness_value = int(float(value))
-            
-            # Try different brightness control methods
-            brightness_paths = [
-                '/sys/class/backlight/intel_backlight/brightness',
-                '/sys/class/backlight/acpi_video0/brightness',
-                '/sys/class/backlight/amdgpu_bl0/brightness'
-            ]
-            
-            for path in brightness_paths:
-                if os.path.exists(path):
-                    max_brightness_path = path.replace('brightness', 'max_brightness')
-                    try:
-                        with open(max_brightness_path, 'r') as f:
-                            max_brightness = int(f.read().strip())
-                        
-                        new_brightness = int((brightness_value / 100) * max_brightness)
-                        cmd = f"echo {new_brightness} | pkexec tee {path}"
-                        subprocess.run(cmd, shell=True, check=True)
+            result = subprocess.run(['xrandr', '--listmonitors'], capture_output=True, text=True)
+            if result.returncode == 0:
+                lines = result.stdout.strip().split('\n')
+                for line in lines[1:]:  # Skip header
+                    if '+*' in line:  # Primary display
+                        self.xrandr_output = line.split()[-1]
                         return
-                    except:
-                        continue
-            
-            # Fallback to xrandr - get actual display name
+        except OSError:
+            pass
+    
+    def write_backlight_direct(self, value):
+        # Backlights writable by the user (e.g. through a udev rule granting
+        # the video group) are written through a held fd, without pkexec
+        if self.backlight_fd is None:
+            if not os.access(self.backlight_path, os.W_OK):
+                return False
+            self.backlight_fd = os.open(self.backlight_path, os.O_WRONLY)
+        os.pwrite(self.backlight_fd, str(value).encode(), 0)
+        return True
+    
+    def write_brightness(self, value):
+        # Raises the backlight error, or the last xrandr one, if nothing worked
+        error = None
+        if self.backlight_path:
             try:
-                result = subprocess.run(['xrandr', '--listmonitors'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines[1:]:  # Skip header
-                        if '+*' in line:  # Primary display
-                            display_name = line.split()[-1]
-                            cmd = f"xrandr --output {display_name} --brightness {brightness_value/100}"
-                            subprocess.run(cmd, shell=True, check=True)
-                            return
-            except:
-                pass
-            
-            # Last resort - try common display names
-            common_displays = ['HDMI-0', 'HDMI-1', 'eDP-1', 'VGA-1', 'DP-1']
-            for display in common_displays:
-                try:
-                    cmd = f"xrandr --output {display} --brightness {brightness_value/100}"
-                    result = subprocess.run(cmd, shell=True, stderr=subprocess.PIPE)
-                    if result.returncode == 0:
-                        return
-                except:
-                    continue
-            
-        except Exception as e:
-            print(f"Error changing brightness: {e}")
+                new_brightness = int((value / 100) * self.max_brightness)
+                if not self.write_backlight_direct(new_brightness):
+                    pkexec_write([(self.backlight_path, new_brightness)])
+                return
+            except (subprocess.CalledProcessError, OSError) as e:
+                error = e
+        
+        # Fallback to xrandr: the display that worked last (or was found at
+        # startup) first, then common display names; remember whichever works
+        displays = [display for display in ['HDMI-0', 'HDMI-1', 'eDP-1', 'VGA-1', 'DP-1']
+                    if display != self.xrandr_output]
+        if self.xrandr_output:
+            displays.insert(0, self.xrandr_output)
+        for display in displays:
+            args = ['xrandr', '--output', display, '--brightness', str(value / 100)]
+            try:
+                result = subprocess.run(args, stderr=subprocess.PIPE)
+            except OSError as e:
+                raise error or e
+            if result.returncode == 0:
+                self.xrandr_output = display
+                return
+            if display == self.xrandr_output:
+                # The output went away with a monitor change; probe again
+                self.xrandr_output = None
+            error = error or subprocess.CalledProcessError(result.returncode, args, stderr=result.stderr)
+        raise error
     
     def run(self):
         self.root.mainloop()
         self.monitor.stop()
+        self.executor.shutdown(wait=False)
 
 def main():
     try:
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Privileged sysfs writer for Lenovo Control Center.
+
+Started once per session through pkexec. Reads "path value" lines on stdin,
+writes each value and answers "ok" or "error: <message>" on stdout.
+"""
+
+import sys
+import re
+
+# Only the attributes the control center actually changes may be written
+ALLOWED_PATHS = [re.compile(pattern) for pattern in (
+    r'^/sys/class/hwmon/hwmon\d+/pwm\d+(_enable)?$',
+    r'^/sys/class/drm/card\d+/device/power_dpm_force_performance_level$',
+    r'^/sys/devices/system/cpu/(cpu\d+/cpufreq|cpufreq/policy\d+)/scaling_governor$',
+    r'^/sys/class/backlight/[\w:.-]+/brightness$',
+    r'^/sys/class/power_supply/BAT\d+/charge_(start|stop)_threshold$',
+)]
+VALUE_RE = re.compile(r'^[\w-]+$')
+
+def write_attribute(path, value):
+    """Write value to path if both are allowed, returning the reply line"""
+    if '..' in path.split('/') or not any(p.match(path) for p in ALLOWED_PATHS):
+        return f"error: {path} is not a writable control"
+    if not VALUE_RE.match(value):
+        return f"error: invalid value {value!r}"
+    try:
+        with open(path, 'w') as f:
+            f.write(f"{value}\n")
+        return "ok"
+    except OSError as e:
+        return f"error: {e.strerror}"
+
+def main():
+    for line in sys.stdin:
+        path, _, value = line.strip().partition(' ')
+        print(write_attribute(path, value), flush=True)
+
+if __name__ == "__main__":
+    main()